@@ -60,7 +60,12 @@ def cli():
     is_flag=True,
     help="Preview without making changes"
 )
-def republish(config: Path, dry_run: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help="Ignore the metadata cache and re-parse every note"
+)
+def republish(config: Path, dry_run: bool, no_cache: bool):
     """Republish all eligible notes.
 
     Discovers all notes matching the tag filters and publishes them
@@ -68,7 +73,7 @@ def republish(config: Path, dry_run: bool):
     and cleans up orphaned images.
     """
     try:
-        publisher = create_publisher_from_config(config)
+        publisher = create_publisher_from_config(config, use_cache=not no_cache)
         result = publisher.republish(dry_run=dry_run)
         print_result(result)
 
@@ -96,7 +101,12 @@ def republish(config: Path, dry_run: bool):
     is_flag=True,
     help="Preview without making changes"
 )
-def add(note_path: str, config: Path, dry_run: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help="Ignore the metadata cache and re-parse every note"
+)
+def add(note_path: str, config: Path, dry_run: bool, no_cache: bool):
     """Add or update a specific note.
 
     Publishes a single note. The note must match the configured
@@ -110,7 +120,7 @@ def add(note_path: str, config: Path, dry_run: bool):
         obsidian-publish add ~/Vault/Zettelkasten/topic.md
     """
     try:
-        publisher = create_publisher_from_config(config)
+        publisher = create_publisher_from_config(config, use_cache=not no_cache)
         result = publisher.add(note_path, dry_run=dry_run)
         print_result(result)
 
@@ -138,7 +148,12 @@ def add(note_path: str, config: Path, dry_run: bool):
     is_flag=True,
     help="Preview without making changes"
 )
-def delete(note_path: str, config: Path, dry_run: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help="Ignore the metadata cache and re-parse every note"
+)
+def delete(note_path: str, config: Path, dry_run: bool, no_cache: bool):
     """Delete a published note.
 
     Removes the published note and cleans up any orphaned images
@@ -152,7 +167,7 @@ def delete(note_path: str, config: Path, dry_run: bool):
         obsidian-publish delete ~/Vault/Zettelkasten/topic.md
     """
     try:
-        publisher = create_publisher_from_config(config)
+        publisher = create_publisher_from_config(config, use_cache=not no_cache)
         result = publisher.delete(note_path, dry_run=dry_run)
         print_result(result)
 
@@ -174,13 +189,18 @@ def delete(note_path: str, config: Path, dry_run: bool):
     default='config.yaml',
     help='Path to configuration file'
 )
-def list_notes(config: Path):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help="Ignore the metadata cache and re-parse every note"
+)
+def list_notes(config: Path, no_cache: bool):
     """List all publishable notes.
 
     Shows all notes in the vault that match the configured tag filters.
     """
     try:
-        publisher = create_publisher_from_config(config)
+        publisher = create_publisher_from_config(config, use_cache=not no_cache)
         notes = publisher.discovery.discover_all()
 
         if not notes:
@@ -252,6 +272,9 @@ max_image_width: 1920
 webp_quality: 85
 image_path_prefix: /images
 
+# Cache parsed note metadata between runs (omit to disable)
+cache_path: ~/.cache/obsidian-publisher/metadata.pickle
+
 # Link transform: relative, absolute, or hugo_ref
 link_transform:
   type: absolute
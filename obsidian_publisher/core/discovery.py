@@ -1,17 +1,119 @@
 """Vault discovery module for finding publishable notes."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-import yaml
-import inflection
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+import dataclasses
+import os
+import pickle
+import sys
 import datetime
 
 from obsidian_publisher.core.models import NoteContext, NoteError, NoteMetadata
+from obsidian_publisher.core.frontmatter import (
+    HEADER_CHUNK_BYTES,
+    MAX_FRONTMATTER_BYTES,
+    read_frontmatter,
+)
+from obsidian_publisher.core.slugs import parameterize
+
+
+def _format_date(value: datetime.date) -> str:
+    """Format a date as YYYY-MM-DD.
+
+    isoformat() is several times faster than strftime() and identical for
+    four-digit years; strftime's unpadded %Y is kept for the rest.
+    """
+    return value.isoformat() if value.year >= 1000 else value.strftime('%Y-%m-%d')
+
+
+# Exact-type dispatch for _get_date_string. datetime must map separately
+# from date since it subclasses date but formats with a time component.
+_DATE_HANDLERS = {
+    str: lambda v: v,
+    datetime.datetime: lambda v: v.strftime('%Y-%m-%d %H:%M:%S%z'),
+    datetime.date: _format_date,
+}
+
+# Exact-type dispatch for _extract_tags; anything else yields no tags
+_TAG_NORMALIZERS = {
+    list: lambda v: [sys.intern(str(tag)) for tag in v],
+    str: lambda v: [sys.intern(v)],
+}
+
+
+def _find_handler(handlers: Dict[type, Callable], value: Any) -> Optional[Callable]:
+    """Look up a handler by exact type, falling back to the MRO for subclasses.
+
+    Args:
+        handlers: Mapping of type -> handler
+        value: Value to dispatch on
+
+    Returns:
+        The handler for value's type or nearest base, or None
+    """
+    handler = handlers.get(type(value))
+    if handler is None:
+        handler = next((handlers[t] for t in type(value).__mro__ if t in handlers), None)
+    return handler
+
+
+def _parse_note_worker(
+    file_path: Path, max_frontmatter_bytes: Optional[int] = None
+) -> Tuple[Optional[NoteMetadata], Optional[Exception]]:
+    """Parse a single note in a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor. Errors are
+    returned rather than raised so the parent can record them per note.
+
+    Args:
+        file_path: Path to the markdown file
+        max_frontmatter_bytes: Header size cap (default: class default)
+
+    Returns:
+        Tuple of (metadata, error) where exactly one is None
+    """
+    try:
+        return VaultDiscovery._parse_note(file_path, max_frontmatter_bytes), None
+    except Exception as e:
+        return None, e
+
+
+def _parse_notes_worker(
+    file_paths: List[Path], max_frontmatter_bytes: Optional[int] = None
+) -> List[Tuple[Optional[NoteMetadata], Optional[Exception]]]:
+    """Parse a batch of notes in a worker process.
+
+    Batching amortizes the pickling round trip over several notes.
+
+    Args:
+        file_paths: Paths to the markdown files
+        max_frontmatter_bytes: Header size cap (default: class default)
+
+    Returns:
+        List of (metadata, error) tuples, one per path
+    """
+    return [_parse_note_worker(p, max_frontmatter_bytes) for p in file_paths]
 
 
 class VaultDiscovery:
     """Discovers and filters notes eligible for publishing from an Obsidian vault."""
 
+    # Below this many notes, process pool startup costs more than it saves
+    PARALLEL_THRESHOLD = 64
+
+    # Notes per worker task; amortizes IPC without starving idle workers
+    PARALLEL_BATCH_SIZE = 32
+
+    # Bump whenever the pickled NoteMetadata/NoteContext layout changes
+    CACHE_VERSION = 3
+
+    # Default upper bound on how much of a file is scanned for the closing ---
+    MAX_FRONTMATTER_BYTES = MAX_FRONTMATTER_BYTES
+
+    # Read size for header scanning; most frontmatter fits in the first chunk
+    HEADER_CHUNK_BYTES = HEADER_CHUNK_BYTES
+
     def __init__(
         self,
         vault_path: Path,
@@ -19,6 +121,8 @@ class VaultDiscovery:
         required_tags: Optional[List[str]] = None,
         excluded_tags: Optional[List[str]] = None,
         fail_fast: bool = False,
+        cache_path: Optional[Path] = None,
+        max_frontmatter_bytes: Optional[int] = None,
     ):
         """Initialize VaultDiscovery.
 
@@ -28,15 +132,27 @@ class VaultDiscovery:
             required_tags: Tags that must be present for a note to be publishable
             excluded_tags: Tags that exclude a note from publishing
             fail_fast: If True, raise exception on first parse error
+            cache_path: Optional file for caching parsed metadata across runs.
+                        Entries are reused while a note's mtime and size match.
+            max_frontmatter_bytes: Headers larger than this are treated as
+                                   unclosed (default: MAX_FRONTMATTER_BYTES)
         """
         self.vault_path = Path(vault_path)
         self.source_dirs = [
             self.vault_path / d for d in (source_dirs or ["."])
         ]
-        self.required_tags = set(required_tags or [])
-        self.excluded_tags = set(excluded_tags or [])
+        self.required_tags: FrozenSet[str] = frozenset(
+            sys.intern(str(t)) for t in (required_tags or ())
+        )
+        self.excluded_tags: FrozenSet[str] = frozenset(
+            sys.intern(str(t)) for t in (excluded_tags or ())
+        )
         self.fail_fast = fail_fast
         self.errors: List[NoteError] = []
+        self.max_frontmatter_bytes = max_frontmatter_bytes or self.MAX_FRONTMATTER_BYTES
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache: Dict[str, Tuple[int, int, NoteMetadata]] = self._load_cache()
+        self._cache_dirty = False
 
     def discover_all(self) -> List[NoteMetadata]:
         """Find all publishable notes in the vault.
@@ -44,28 +160,159 @@ class VaultDiscovery:
         Returns:
             List of NoteMetadata for all notes passing the tag filters
         """
-        existing_dirs = [d for d in self.source_dirs if d.exists()]
-
+        # Validate every source dir up front, before any file is touched
+        existing_dirs = []
         for d in self.source_dirs:
-            if not d.exists():
+            if os.path.isdir(d):
+                existing_dirs.append(d)
+            else:
                 print(f"Warning: Source directory not found: {d}")
 
         if not existing_dirs:
             dirs = ', '.join(str(d) for d in self.source_dirs)
             raise FileNotFoundError(f"No source directories found: {dirs}")
 
-        publishable = []
-        for source_dir in existing_dirs:
-            for note_path in source_dir.glob("*.md"):
-                metadata = self._get_note_metadata(note_path)
-                if metadata is None:
-                    continue
+        entries = [
+            entry
+            for source_dir in existing_dirs
+            for entry in self._iter_markdown(source_dir)
+        ]
+        paths = [Path(entry.path) for entry in entries]
+
+        notes: List[Optional[NoteMetadata]] = []
+        pending = []
+        for note_path, entry in zip(paths, entries):
+            signature, cached = self._lookup_cache(note_path, entry)
+            if cached is None:
+                pending.append((len(notes), note_path, signature))
+            notes.append(cached)
+
+        pending_paths = [note_path for _, note_path, _ in pending]
+        if len(pending_paths) < self.PARALLEL_THRESHOLD:
+            parsed = [self._try_parse_note(p) for p in pending_paths]
+        else:
+            self._prefetch(pending_paths)
+            parsed = self._parse_parallel(pending_paths)
+
+        for (index, note_path, signature), metadata in zip(pending, parsed):
+            notes[index] = metadata
+            self._store_cache(note_path, signature, metadata)
+
+        self._save_cache(paths)
 
-                is_pub, _ = self.is_publishable(metadata)
-                if is_pub:
-                    publishable.append(metadata)
+        return self._select_publishable([n for n in notes if n is not None])
 
-        return publishable
+    def _select_publishable(self, notes: List[NoteMetadata]) -> List[NoteMetadata]:
+        """Apply the tag filters to many notes at once.
+
+        Builds an inverted index from each filter tag to the positions of
+        the notes carrying it, so filtering costs one pass over the tags
+        plus set operations rather than a per-note is_publishable() call.
+        Agrees with is_publishable() for every note.
+
+        Args:
+            notes: Parsed notes in discovery order
+
+        Returns:
+            The publishable notes, in their original order
+        """
+        if not self.required_tags and not self.excluded_tags:
+            return notes
+
+        filter_tags = self.required_tags | self.excluded_tags
+        tag_index: Dict[str, Set[int]] = {}
+        for i, note in enumerate(notes):
+            for tag in note.tag_set & filter_tags:
+                tag_index.setdefault(tag, set()).add(i)
+
+        if self.required_tags:
+            keep = set().union(*(tag_index.get(t, ()) for t in self.required_tags))
+        else:
+            keep = set(range(len(notes)))
+        keep.difference_update(*(tag_index.get(t, ()) for t in self.excluded_tags))
+
+        return [notes[i] for i in sorted(keep)]
+
+    @staticmethod
+    def _iter_markdown(source_dir: Path) -> Iterator[os.DirEntry]:
+        """Yield markdown files directly inside a directory.
+
+        Uses os.scandir rather than Path.glob so file type comes from the
+        directory entry instead of a per-entry stat. Entries are yielded
+        as-is so the cache can reuse their memoized stat().
+
+        Args:
+            source_dir: Directory to list
+
+        Yields:
+            os.DirEntry for each .md file
+        """
+        with os.scandir(source_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file():
+                    yield entry
+
+    def _parse_parallel(self, paths: List[Path]) -> List[Optional[NoteMetadata]]:
+        """Parse notes across a process pool.
+
+        Paths are submitted in batches of PARALLEL_BATCH_SIZE and results are
+        reduced in submission order, so errors are recorded exactly as the
+        sequential path would record them. With fail_fast, batches that
+        have not started yet are cancelled on the first error.
+
+        Args:
+            paths: Markdown files to parse
+
+        Returns:
+            List of NoteMetadata (None for notes that failed to parse)
+        """
+        notes = []
+        batch = self.PARALLEL_BATCH_SIZE
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    _parse_notes_worker, paths[i:i + batch], self.max_frontmatter_bytes
+                )
+                for i in range(0, len(paths), batch)
+            ]
+            results = (result for future in futures for result in future.result())
+            for file_path, (metadata, error) in zip(paths, results):
+                if error is not None:
+                    self.errors.append(NoteError(path=file_path, error=str(error)))
+                    if self.fail_fast:
+                        executor.shutdown(cancel_futures=True)
+                        raise error
+                if metadata is not None:
+                    metadata = self._reintern_tags(metadata)
+                notes.append(metadata)
+        return notes
+
+    @staticmethod
+    def _prefetch(paths: List[Path]) -> None:
+        """Hint the kernel to start reading note headers ahead of parsing.
+
+        Issued for the whole batch before work is handed to the pool, so
+        readahead for later files overlaps with parsing of earlier ones.
+        A no-op where posix_fadvise is unavailable.
+
+        Args:
+            paths: Notes about to be parsed
+        """
+        fadvise = getattr(os, 'posix_fadvise', None)
+        if fadvise is None:
+            return
+        length = VaultDiscovery.HEADER_CHUNK_BYTES
+        for file_path in paths:
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
 
     def get_note_metadata(self, file_path: Path) -> Optional[NoteMetadata]:
         """Parse a note file and extract metadata.
@@ -89,20 +336,25 @@ class VaultDiscovery:
         Returns:
             Tuple of (is_publishable, reason)
         """
-        note_tags = set(note.tags)
+        if not self.required_tags and not self.excluded_tags:
+            return True, "OK"
 
-        if self.required_tags and not self.required_tags.intersection(note_tags):
+        note_tags = note.tag_set
+
+        if self.required_tags and self.required_tags.isdisjoint(note_tags):
             missing = ', '.join(self.required_tags)
             return False, f"Missing required tags: {missing}"
 
-        excluded_found = self.excluded_tags.intersection(note_tags)
+        excluded_found = self.excluded_tags & note_tags
         if excluded_found:
             found = ', '.join(excluded_found)
             return False, f"Contains excluded tags: {found}"
 
         return True, "OK"
 
-    def _get_note_metadata(self, file_path: Path) -> Optional[NoteMetadata]:
+    def _get_note_metadata(
+        self, file_path: Path, entry: Optional[os.DirEntry] = None
+    ) -> Optional[NoteMetadata]:
         """Parse a note file and extract metadata.
 
         Note: Content is NOT stored in NoteMetadata. Use context.read_raw()
@@ -110,66 +362,213 @@ class VaultDiscovery:
 
         Args:
             file_path: Path to the markdown file
+            entry: Directory entry for the file, if it came from a scan
 
         Returns:
             NoteMetadata or None if parsing fails
         """
+        signature, cached = self._lookup_cache(file_path, entry)
+        if cached is not None:
+            return cached
+
+        metadata = self._try_parse_note(file_path)
+        self._store_cache(file_path, signature, metadata)
+        return metadata
+
+    def _try_parse_note(self, file_path: Path) -> Optional[NoteMetadata]:
+        """Parse a note, recording any error instead of raising.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            NoteMetadata or None if parsing fails
+
+        Raises:
+            Exception: The parse error, if fail_fast is set
+        """
         try:
-            context = NoteContext(path=file_path)
-            frontmatter = self._parse_frontmatter(file_path)
-            tags = self._extract_tags(frontmatter)
-            title = frontmatter.get('title', file_path.stem)
-            slug = inflection.parameterize(title)
-            creation_date = self._get_date_string(frontmatter.get('created'))
-            publication_date = self._get_date_string(frontmatter.get('date'))
-
-            return NoteMetadata(
-                context=context,
-                title=title,
-                slug=slug,
-                frontmatter=frontmatter,
-                tags=tags,
-                creation_date=creation_date,
-                publication_date=publication_date,
-            )
+            return self._parse_note(file_path, self.max_frontmatter_bytes)
         except Exception as e:
             self.errors.append(NoteError(path=file_path, error=str(e)))
             if self.fail_fast:
                 raise
             return None
 
-    def _parse_frontmatter(self, file_path: Path) -> Dict:
-        """Parse YAML frontmatter from markdown file.
+    def _load_cache(self) -> Dict[str, Tuple[int, int, NoteMetadata]]:
+        """Load the metadata cache from disk.
+
+        Returns:
+            Cache dict (empty if caching is disabled or the file is unusable)
+        """
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return {}
+
+        # Entries pickled by an older NoteMetadata layout, or parsed under a
+        # different header cap, are discarded
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != self.CACHE_VERSION
+            or data.get('max_frontmatter_bytes') != self.max_frontmatter_bytes
+        ):
+            return {}
+        notes = data.get('notes')
+        if not isinstance(notes, dict):
+            return {}
+        return {
+            key: (mtime_ns, size, self._reintern_tags(metadata))
+            for key, (mtime_ns, size, metadata) in notes.items()
+        }
+
+    def _save_cache(self, paths: List[Path]) -> None:
+        """Persist cache entries for the given notes, dropping all others.
+
+        The file is only rewritten when an entry was added or pruned, so a
+        run over an unchanged vault does no cache writes at all.
+
+        Args:
+            paths: Notes seen in the current discovery pass
+        """
+        if self.cache_path is None:
+            return
+
+        keys = (str(p) for p in paths)
+        pruned = {k: self._cache[k] for k in keys if k in self._cache}
+        if len(pruned) != len(self._cache):
+            self._cache = pruned
+            self._cache_dirty = True
+        if not self._cache_dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(
+                {
+                    'version': self.CACHE_VERSION,
+                    'max_frontmatter_bytes': self.max_frontmatter_bytes,
+                    'notes': self._cache,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, self.cache_path)
+        self._cache_dirty = False
+
+    def _lookup_cache(
+        self, file_path: Path, entry: Optional[os.DirEntry] = None
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[NoteMetadata]]:
+        """Look up cached metadata for a note.
+
+        Args:
+            file_path: Path to the markdown file
+            entry: Directory entry for the file; its stat() is used when given
+
+        Returns:
+            Tuple of (file signature, cached metadata). The signature is None
+            when caching is disabled; metadata is None on a cache miss.
+        """
+        if self.cache_path is None:
+            return None, None
+
+        try:
+            stat = entry.stat() if entry is not None else os.stat(file_path)
+        except OSError:
+            return None, None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._cache.get(str(file_path))
+        if entry is not None and entry[:2] == signature:
+            return signature, entry[2]
+        return signature, None
+
+    def _store_cache(
+        self,
+        file_path: Path,
+        signature: Optional[Tuple[int, int]],
+        metadata: Optional[NoteMetadata],
+    ) -> None:
+        """Remember freshly parsed metadata. Failed parses are not cached.
 
         Args:
             file_path: Path to the markdown file
+            signature: (mtime_ns, size) taken before parsing
+            metadata: Parsed metadata, or None if parsing failed
+        """
+        if signature is None or metadata is None:
+            return
+        self._cache[str(file_path)] = (signature[0], signature[1], metadata)
+        self._cache_dirty = True
+
+    @staticmethod
+    def _parse_note(
+        file_path: Path, max_frontmatter_bytes: Optional[int] = None
+    ) -> NoteMetadata:
+        """Build NoteMetadata for a file without touching discovery state.
+
+        Args:
+            file_path: Path to the markdown file
+            max_frontmatter_bytes: Header size cap (default: MAX_FRONTMATTER_BYTES)
 
         Returns:
-            Frontmatter dict (empty if no frontmatter found)
+            NoteMetadata for the note
 
         Raises:
-            yaml.YAMLError: If frontmatter YAML is malformed
+            Exception: Any error raised while reading or parsing the file
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        frontmatter, body_offset = VaultDiscovery._read_frontmatter(
+            file_path, max_frontmatter_bytes
+        )
+        context = NoteContext(path=file_path, body_offset=body_offset)
+        tags = VaultDiscovery._extract_tags(frontmatter)
+        title = frontmatter.get('title', file_path.stem)
+        slug = parameterize(title)
+        creation_date = VaultDiscovery._get_date_string(frontmatter.get('created'))
+        publication_date = VaultDiscovery._get_date_string(frontmatter.get('date'))
+
+        return NoteMetadata(
+            context=context,
+            title=title,
+            slug=slug,
+            frontmatter=frontmatter,
+            tags=tags,
+            creation_date=creation_date,
+            publication_date=publication_date,
+        )
+
+    @staticmethod
+    def _read_frontmatter(
+        file_path: Path, max_frontmatter_bytes: Optional[int] = None
+    ) -> Tuple[Dict, Optional[int]]:
+        """Parse YAML frontmatter from markdown file.
 
-        if not content.startswith('---'):
-            return {}
+        See core.frontmatter.read_frontmatter for the scanning rules.
 
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return {}
+        Args:
+            file_path: Path to the markdown file
+            max_frontmatter_bytes: Header size cap (default: MAX_FRONTMATTER_BYTES)
 
-        frontmatter = yaml.safe_load(parts[1])
-        if not isinstance(frontmatter, dict):
-            return {}
+        Returns:
+            Tuple of (frontmatter dict, empty if no frontmatter found;
+            byte offset of the body, or None if unknown)
 
-        return frontmatter
+        Raises:
+            yaml.YAMLError: If frontmatter YAML is malformed
+        """
+        return read_frontmatter(file_path, max_frontmatter_bytes)
 
-    def _extract_tags(self, frontmatter: Dict) -> List[str]:
+    @staticmethod
+    def _extract_tags(frontmatter: Dict) -> List[str]:
         """Extract all tags from frontmatter.
 
-        Handles both list and string formats.
+        Handles both list and string formats. Tags are interned since the
+        same few strings repeat across every note in a vault.
 
         Args:
             frontmatter: Parsed frontmatter dict
@@ -177,18 +576,29 @@ class VaultDiscovery:
         Returns:
             List of tag strings
         """
-        tags = []
+        tag_data = frontmatter.get('tags')
+        normalize = _find_handler(_TAG_NORMALIZERS, tag_data)
+        return normalize(tag_data) if normalize is not None else []
 
-        if 'tags' in frontmatter:
-            tag_data = frontmatter['tags']
-            if isinstance(tag_data, list):
-                tags.extend(str(tag) for tag in tag_data)
-            elif isinstance(tag_data, str):
-                tags.append(tag_data)
+    @staticmethod
+    def _reintern_tags(metadata: NoteMetadata) -> NoteMetadata:
+        """Re-intern tags on metadata that crossed a pickle boundary.
 
-        return tags
+        Unpickling (from the cache file or a worker process) yields fresh
+        string objects, losing the identity sharing _extract_tags set up.
 
-    def _get_date_string(self, date_value) -> str:
+        Args:
+            metadata: Unpickled note metadata
+
+        Returns:
+            A copy with interned tags; __post_init__ rebuilds tag_set
+        """
+        return dataclasses.replace(
+            metadata, tags=[sys.intern(tag) for tag in metadata.tags]
+        )
+
+    @staticmethod
+    def _get_date_string(date_value) -> str:
         """Convert various date formats to string.
 
         Args:
@@ -200,13 +610,8 @@ class VaultDiscovery:
         if date_value is None:
             return ""
 
-        if isinstance(date_value, str):
-            return date_value
-
-        if isinstance(date_value, datetime.datetime):
-            return date_value.strftime('%Y-%m-%d %H:%M:%S%z')
-
-        if isinstance(date_value, datetime.date):
-            return date_value.strftime('%Y-%m-%d')
+        handler = _find_handler(_DATE_HANDLERS, date_value)
+        if handler is not None:
+            return handler(date_value)
 
         return str(date_value)
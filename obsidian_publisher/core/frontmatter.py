@@ -0,0 +1,117 @@
+"""Frontmatter splitting and YAML loading shared by the core modules."""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+# Prefer the LibYAML-backed loader; frontmatter parsing dominates discovery.
+# Only loading is accelerated: LibYAML's emitter escapes astral characters, so
+# output keeps the pure-Python dumper (see ContentProcessor.build_output).
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+_DELIMITER = '---\n'
+
+# Default upper bound on how much of a file is scanned for the closing ---
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+# Read size for header scanning; most frontmatter fits in the first chunk
+HEADER_CHUNK_BYTES = 8192
+
+
+def split_frontmatter(text: str) -> Tuple[Optional[str], str]:
+    """Split a markdown document into its YAML header and body.
+
+    Equivalent to text.split('---\\n', 2) for documents starting with ---,
+    without building the parts list or scanning past the closing delimiter.
+
+    Args:
+        text: Full document text
+
+    Returns:
+        Tuple of (header text or None if there is no closed header, body)
+    """
+    if not text.startswith('---'):
+        return None, text
+
+    opening = text.find(_DELIMITER)
+    if opening < 0:
+        return None, text
+    closing = text.find(_DELIMITER, opening + 4)
+    if closing < 0:
+        return None, text
+    return text[opening + 4:closing], text[closing + 4:]
+
+
+def read_frontmatter(
+    file_path: Path, max_bytes: Optional[int] = None
+) -> Tuple[Dict, Optional[int]]:
+    """Parse the YAML frontmatter of a markdown file without reading its body.
+
+    The file is consumed in HEADER_CHUNK_BYTES chunks until the closing
+    delimiter, so note bodies are never loaded or decoded. Headers larger
+    than max_bytes are treated as unclosed.
+
+    The body offset is where ContentProcessor would start the note body.
+    It is None whenever that can't be given as a raw byte offset (CR line
+    endings inside the header, or a header that is rejected here but the
+    processor would still strip).
+
+    Args:
+        file_path: Path to the markdown file
+        max_bytes: Header size cap (default: MAX_FRONTMATTER_BYTES)
+
+    Returns:
+        Tuple of (frontmatter dict, empty if no frontmatter found;
+        byte offset of the body, or None if unknown)
+
+    Raises:
+        yaml.YAMLError: If frontmatter YAML is malformed
+    """
+    limit = max_bytes or MAX_FRONTMATTER_BYTES
+    with open(file_path, 'rb') as f:
+        buf = f.read(HEADER_CHUNK_BYTES)
+        if not buf.startswith(b'---'):
+            return {}, 0
+
+        start = -1
+        while True:
+            # Match text-mode universal newlines so CRLF notes still parse
+            norm = buf.replace(b'\r\n', b'\n').replace(b'\r', b'\n') if b'\r' in buf else buf
+            if start < 0:
+                newline = norm.find(b'\n')
+                if newline >= 0:
+                    # The opening line must itself end with ---
+                    if not norm.startswith(b'---\n', newline - 3):
+                        return {}, None
+                    start = newline + 1
+                elif len(norm) > limit:
+                    return {}, None
+            if start >= 0:
+                end = norm.find(b'---\n', start)
+                if end - start > limit or (end < 0 and len(norm) - start > limit):
+                    return {}, None
+                if end >= 0:
+                    break
+            chunk = f.read(HEADER_CHUNK_BYTES)
+            if not chunk:
+                return {}, None
+            buf += chunk
+
+    first_cr = buf.find(b'\r')
+    body_offset = end + 4 if first_cr < 0 or first_cr >= end + 4 else None
+
+    text = norm[start:end].decode('utf-8')
+    try:
+        frontmatter = yaml.load(text, Loader=SafeLoader)
+    except yaml.YAMLError:
+        # LibYAML errors omit the offending source line; re-parse with the
+        # pure-Python loader so the recorded error stays readable
+        frontmatter = yaml.safe_load(text)
+    if not isinstance(frontmatter, dict):
+        return {}, body_offset
+
+    return frontmatter, body_offset
@@ -2,10 +2,10 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NoteContext:
     """Cheapest possible note reference - just location.
 
@@ -13,18 +13,36 @@ class NoteContext:
     during discovery.
     """
     path: Path
+    # Byte offset of the body past the frontmatter, if discovery found it
+    body_offset: Optional[int] = None
 
     def read_raw(self) -> str:
         """Read file contents on demand."""
         return self.path.read_text(encoding='utf-8')
 
+    def read_body(self) -> str:
+        """Read only the note body, skipping the frontmatter bytes.
 
-@dataclass
+        Requires body_offset. Line endings are normalized the same way as
+        read_raw().
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self.body_offset)
+            body = f.read().decode('utf-8')
+        if '\r' in body:
+            body = body.replace('\r\n', '\n').replace('\r', '\n')
+        return body
+
+
+@dataclass(slots=True, frozen=True)
 class NoteMetadata:
     """Parsed note metadata - what we learn from reading the file once.
 
     Does NOT store content - get it via context.read_raw() when needed.
     Does NOT store processed_tags - that belongs in ProcessedNote.
+
+    Frozen because one instance is shared between processing threads and
+    the metadata cache.
     """
     context: NoteContext
     title: str
@@ -33,6 +51,11 @@ class NoteMetadata:
     tags: List[str]
     creation_date: str
     publication_date: str
+    # Frozen copy of tags for filter checks, built once per note
+    tag_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'tag_set', frozenset(self.tags))
 
     @property
     def path(self) -> Path:
@@ -40,7 +63,7 @@ class NoteMetadata:
         return self.context.path
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedNote:
     """Result of transforming a note for publishing.
 
@@ -55,7 +78,7 @@ class ProcessedNote:
     missing_links: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteError:
     """An error that occurred while processing a note.
 
@@ -66,7 +89,7 @@ class NoteError:
     title: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PublishResult:
     """Result of a publish operation."""
     published_titles: List[str] = field(default_factory=list)
@@ -1,47 +1,80 @@
 """Content processor for transforming Obsidian notes."""
 
+import os
 import re
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
-import inflection
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
 import yaml
 
+from obsidian_publisher.core.frontmatter import split_frontmatter
 from obsidian_publisher.core.models import NoteMetadata, ProcessedNote
+from obsidian_publisher.core.slugs import parameterize
 from obsidian_publisher.transforms.links import LinkTransform
 from obsidian_publisher.transforms.tags import TagTransform
 from obsidian_publisher.transforms.frontmatter import FrontmatterTransform
 
+# Wikilinks and embeds: [[target]], [[target|display]], ![[image.png]] or
+# ![[image.png|alt]]. Compiled once at import and shared by every processor.
+# Targets and display text never span a newline or another "[[", so a stray
+# "[[" in prose can't swallow a later link or embed.
+_EMBED_RE = re.compile(
+    r'(?P<bang>!)?\[\['
+    r'(?P<target>(?:[^\[\]|\n]|\[(?!\[))+)'
+    r'(?:\|(?P<display>(?:[^\[\]\n]|\[(?!\[))+))?'
+    r'\]\]',
+    re.ASCII,
+)
+
+# Extensions (without the dot) of wikilink targets that refer to images
+_IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'})
+
+
+def _is_image(target: str) -> bool:
+    """Check whether a wikilink target names an image, by its extension."""
+    _, dot, ext = target.rpartition('.')
+    return bool(dot) and ext.lower() in _IMAGE_EXTENSIONS
+
 
 @dataclass
 class LinkIndex:
-    """Index mapping note titles to their slugs."""
+    """Index mapping note titles to their slugs.
+
+    Keys of title_to_slug are case-folded and interned at construction, so a
+    lookup costs one casefold() and one dict probe. Results are memoized by
+    the raw title, since documents link the same notes over and over; the
+    index is not meant to change after construction.
+    """
 
     title_to_slug: Dict[str, str]
     slug_to_title: Dict[str, str]
+    _memo: Dict[str, Optional[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_notes(cls, notes: List[NoteMetadata]) -> "LinkIndex":
         """Build a link index from a list of notes."""
-        title_to_slug = {}
-        slug_to_title = {}
-
-        for note in notes:
-            title_to_slug[note.title.lower()] = note.slug
-            slug_to_title[note.slug] = note.title
-
+        title_to_slug = {sys.intern(note.title.casefold()): note.slug for note in notes}
+        slug_to_title = {note.slug: note.title for note in notes}
         return cls(title_to_slug, slug_to_title)
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "LinkIndex":
         """Build a link index from a title->slug dictionary."""
-        title_to_slug = {k.lower(): v for k, v in data.items()}
+        title_to_slug = {sys.intern(k.casefold()): v for k, v in data.items()}
         slug_to_title = {v: k for k, v in data.items()}
         return cls(title_to_slug, slug_to_title)
 
     def get_slug(self, title: str) -> Optional[str]:
         """Get slug for a title, case-insensitive."""
-        return self.title_to_slug.get(title.lower())
+        try:
+            return self._memo[title]
+        except KeyError:
+            slug = self._memo[title] = self.title_to_slug.get(title.casefold())
+            return slug
 
 
 class ContentProcessor:
@@ -54,14 +87,11 @@ class ContentProcessor:
     - Frontmatter transformation
     """
 
-    # Pattern for wikilinks: [[target]] or [[target|display]]
-    WIKILINK_PATTERN = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
+    # Pattern for wikilinks and embeds, kept as a class attribute for callers
+    EMBED_PATTERN = _EMBED_RE
 
-    # Pattern for image embeds: ![[image.png]] or ![[image.png|alt]]
-    IMAGE_EMBED_PATTERN = re.compile(r'!\[\[([^\]|]+\.(?:png|jpg|jpeg|gif|webp|svg))(?:\|([^\]]+))?\]\]', re.IGNORECASE)
-
-    # Pattern for generic embeds (notes): ![[note]]
-    NOTE_EMBED_PATTERN = re.compile(r'!\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
+    # Below this many notes, process_many skips the thread pool
+    PARALLEL_THRESHOLD = 16
 
     def __init__(
         self,
@@ -96,7 +126,8 @@ class ContentProcessor:
     def process(self, note: NoteMetadata) -> ProcessedNote:
         """Process a note's content for publishing.
 
-        Reads content lazily via note.context.read_raw().
+        Reads content lazily via note.context, seeking straight to the body
+        when discovery recorded its offset.
 
         Args:
             note: The note metadata to process
@@ -104,39 +135,74 @@ class ContentProcessor:
         Returns:
             ProcessedNote with transformed content and metadata
         """
-        raw_content = note.context.read_raw()
-        content = self._extract_content(raw_content)
-
-        referenced_images: Set[str] = set()
-        missing_links: List[str] = []
-
-        # Images must be processed before wikilinks to avoid double-processing
-        content, images = self._process_images(content)
-        referenced_images.update(images)
+        if note.context.body_offset is not None:
+            # Discovery already located the body; skip re-reading the header
+            content = note.context.read_body()
+        else:
+            content = self._extract_content(note.context.read_raw())
 
-        content, missing = self._process_wikilinks(content)
-        missing_links.extend(missing)
+        content, referenced_images, missing_links = self._process_embeds(content)
 
         processed_tags = note.tags.copy()
         if self.tag_transform:
             processed_tags = self.tag_transform(note.tags)
 
+        # One copy serves both the ProcessedNote and the transform input;
+        # note.frontmatter itself is never handed out for mutation
+        frontmatter = note.frontmatter.copy()
         processed = ProcessedNote(
             metadata=note,
             content=content,
-            frontmatter=note.frontmatter.copy(),
+            frontmatter=frontmatter,
             tags=processed_tags,
-            referenced_images=list(referenced_images),
+            referenced_images=referenced_images,
             missing_links=missing_links,
         )
 
         if self.frontmatter_transform:
-            processed.frontmatter = self.frontmatter_transform(
-                note.frontmatter.copy(), processed
-            )
+            processed.frontmatter = self.frontmatter_transform(frontmatter, processed)
 
         return processed
 
+    def process_many(
+        self,
+        notes: List[NoteMetadata],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[ProcessedNote, Exception]]:
+        """Process several notes concurrently on a thread pool.
+
+        Reading note files dominates, and file IO releases the GIL, so reads
+        overlap across threads. The processor is only read during process(),
+        so sharing it between threads is safe. Fewer than PARALLEL_THRESHOLD
+        notes are processed sequentially, where pool startup would dominate.
+
+        Args:
+            notes: Notes to process
+            max_workers: Thread count (default: ThreadPoolExecutor's default)
+            return_exceptions: If True, a note that fails to process yields its
+                exception in place of a ProcessedNote instead of raising
+
+        Returns:
+            Processed notes in the same order as the input
+
+        Raises:
+            Exception: The first processing error, if return_exceptions is False
+        """
+        process = self.process
+        if return_exceptions:
+            def process(note: NoteMetadata) -> Union[ProcessedNote, Exception]:
+                try:
+                    return self.process(note)
+                except Exception as e:
+                    return e
+
+        if len(notes) < self.PARALLEL_THRESHOLD:
+            return [process(note) for note in notes]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(process, notes))
+
     def _extract_content(self, raw_content: str) -> str:
         """Extract content after frontmatter.
 
@@ -146,88 +212,142 @@ class ContentProcessor:
         Returns:
             Content without frontmatter
         """
-        if not raw_content.startswith('---'):
-            return raw_content
-
-        parts = raw_content.split('---\n', 2)
-        if len(parts) >= 3:
-            return parts[2]
-        return raw_content
+        return split_frontmatter(raw_content)[1]
 
-    def _process_images(self, content: str) -> tuple[str, Set[str]]:
-        """Process image embeds in content.
+    def _process_embeds(self, content: str) -> tuple[str, List[str], List[str]]:
+        """Process image embeds and wikilinks in a single pass.
 
         Args:
             content: Note content
 
         Returns:
-            Tuple of (transformed content, set of image filenames)
+            Tuple of (transformed content, list of image filenames, list of
+            missing link targets), each list deduplicated in first-seen order
         """
-        images = set()
+        # Insertion-ordered dicts so repeated references are recorded once
+        # and come back in document order
+        images: Dict[str, None] = {}
+        missing_links: Dict[str, None] = {}
+        # A substring check is much cheaper than running the pattern over a
+        # note that has no wikilinks at all
+        if '[[' not in content:
+            return content, [], []
+
+        # Bound once so the per-match loop does no attribute lookups
+        handlers = self._HANDLERS
+        is_image = _is_image
+
+        # Copy the text between matches and each rendered span into a list,
+        # joined once at the end
+        parts: List[str] = []
+        append = parts.append
+        last = 0
+        for match in _EMBED_RE.finditer(content):
+            start, end = match.span()
+            is_embed, raw_target, display = match.group('bang', 'target', 'display')
+
+            if is_embed and is_image(raw_target):
+                kind = 'image_embed'
+            elif is_image(raw_target.strip()):
+                kind = 'image_link'
+            else:
+                kind = 'link'
+            rendered = handlers[kind](self, raw_target, display, images, missing_links)
+
+            append(content[last:start])
+            # Non-image embeds (![[note]]) keep their "!" as before
+            if is_embed and kind != 'image_embed':
+                append('!')
+            append(rendered)
+            last = end
+
+        if not parts:
+            return content, list(images), list(missing_links)
+
+        append(content[last:])
+        return ''.join(parts), list(images), list(missing_links)
+
+    def _handle_image_embed(
+        self, raw_target: str, display: Optional[str], images: Dict[str, None], missing_links: Dict[str, None]
+    ) -> str:
+        """Handle ![[image.png]]: record the image and render it."""
+        images[raw_target] = None
+        return self._render_image(raw_target, display)
+
+    def _handle_image_link(
+        self, raw_target: str, display: Optional[str], images: Dict[str, None], missing_links: Dict[str, None]
+    ) -> str:
+        """Handle [[image.png]]: render as an image without recording it."""
+        return self._render_image(raw_target.strip(), display)
+
+    def _handle_link(
+        self, raw_target: str, display: Optional[str], images: Dict[str, None], missing_links: Dict[str, None]
+    ) -> str:
+        """Handle [[note]] and [[note#section]]."""
+        return self._render_link(raw_target.strip(), display, missing_links)
+
+    # Dispatch table for _process_embeds, keyed by match kind
+    _HANDLERS = {
+        'image_embed': _handle_image_embed,
+        'image_link': _handle_image_link,
+        'link': _handle_link,
+    }
+
+    def _render_image(self, image_name: str, display: Optional[str]) -> str:
+        """Render an image reference as a markdown image.
 
-        def replace_image(match: re.Match) -> str:
-            image_name = match.group(1)
-            alt_text = match.group(2) or Path(image_name).stem
-            images.add(image_name)
+        Args:
+            image_name: Image filename from the wikilink
+            display: Optional alt text
 
-            stem = Path(image_name).stem
-            slug = inflection.parameterize(stem)
-            ext = self.output_image_extension or Path(image_name).suffix.lower()
-            alt_slug = inflection.parameterize(alt_text)
+        Returns:
+            Markdown image string
+        """
+        # String ops instead of Path(): this runs for every image reference
+        stem, suffix = os.path.splitext(os.path.basename(image_name))
+        alt_text = display or stem
+        slug = parameterize(stem)
+        ext = self.output_image_extension or suffix.lower()
+        alt_slug = parameterize(alt_text)
 
-            return f"![{alt_slug}]({self.image_path_prefix}/{slug}{ext})"
+        return f"![{alt_slug}]({self.image_path_prefix}/{slug}{ext})"
 
-        result = self.IMAGE_EMBED_PATTERN.sub(replace_image, content)
-        return result, images
+    def _render_link(
+        self, target: str, display: Optional[str], missing_links: Dict[str, None]
+    ) -> str:
+        """Render a note wikilink target as a markdown link.
 
-    def _process_wikilinks(self, content: str) -> tuple[str, List[str]]:
-        """Process wikilinks in content.
+        Image targets are dispatched to _render_image before reaching here.
 
         Args:
-            content: Note content
+            target: Stripped wikilink target, optionally with a #section
+            display: Optional display text
+            missing_links: Ordered dict to record unresolved targets in
 
         Returns:
-            Tuple of (transformed content, list of missing link targets)
+            Markdown link string
         """
-        missing_links = []
-
-        def replace_link(match: re.Match) -> str:
-            target = match.group(1).strip()
-            display = match.group(2)
-
-            # Handle image links that weren't caught by IMAGE_EMBED_PATTERN (e.g., [[image.png]] without !)
-            if any(target.lower().endswith(ext) for ext in ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg')):
-                alt_text = display or Path(target).stem
-                stem = Path(target).stem
-                slug = inflection.parameterize(stem)
-                ext = self.output_image_extension or Path(target).suffix.lower()
-                alt_slug = inflection.parameterize(alt_text)
-                return f"![{alt_slug}]({self.image_path_prefix}/{slug}{ext})"
-
-            section = ""
-            note_target = target
-            if "#" in target:
-                note_target, section = target.split("#", 1)
-                note_target = note_target.strip()
-
-            slug = self.link_index.get_slug(note_target)
-            if slug is None:
-                slug = inflection.parameterize(note_target)
-                if self.warn_on_missing_link:
-                    missing_links.append(note_target)
-
-            link_text = display or note_target
-            result = self.link_transform(link_text, slug)
-
-            # Append section anchor by inserting before closing paren
-            if section and ")" in result:
-                section_slug = inflection.parameterize(section)
-                result = result[:-1] + f"#{section_slug})"
-
-            return result
-
-        result = self.WIKILINK_PATTERN.sub(replace_link, content)
-        return result, missing_links
+        section = ""
+        note_target = target
+        if "#" in target:
+            note_target, section = target.split("#", 1)
+            note_target = note_target.strip()
+
+        slug = self.link_index.get_slug(note_target)
+        if slug is None:
+            slug = parameterize(note_target)
+            if self.warn_on_missing_link:
+                missing_links[note_target] = None
+
+        link_text = display or note_target
+        result = self.link_transform(link_text, slug)
+
+        # Append section anchor by inserting before closing paren
+        if section and ")" in result:
+            section_slug = parameterize(section)
+            result = result[:-1] + f"#{section_slug})"
+
+        return result
 
     def build_output(self, processed: ProcessedNote) -> str:
         """Build final markdown output with frontmatter.
@@ -238,14 +358,24 @@ class ContentProcessor:
         Returns:
             Complete markdown string with YAML frontmatter
         """
-        if processed.frontmatter:
-            frontmatter_str = yaml.dump(
-                processed.frontmatter,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=True,
-            )
-            content = processed.content.rstrip('\n')
-            return f"---\n{frontmatter_str}---\n{content}\n"
-        else:
-            return processed.content.rstrip('\n') + "\n"
+        content = processed.content
+        # Normalize to exactly one trailing newline. The newline is added in
+        # the final concatenation so the body is copied at most once.
+        tail = ''
+        if not content.endswith('\n') or content.endswith('\n\n'):
+            content = content.rstrip('\n')
+            tail = '\n'
+
+        if not processed.frontmatter:
+            return content + tail
+
+        # The pure-Python dumper on purpose: LibYAML's emitter escapes astral
+        # characters (emoji) even with allow_unicode, which would rewrite the
+        # frontmatter of already-published notes
+        frontmatter_str = yaml.dump(
+            processed.frontmatter,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=True,
+        )
+        return f"---\n{frontmatter_str}---\n{content}{tail}"
@@ -6,11 +6,11 @@ from typing import Dict, List, Optional, Set
 import json
 import shutil
 
-import inflection
-
 from obsidian_publisher.core.models import NoteError, NoteMetadata, ProcessedNote, PublishResult
 from obsidian_publisher.core.discovery import VaultDiscovery
+from obsidian_publisher.core.frontmatter import read_frontmatter
 from obsidian_publisher.core.processor import ContentProcessor, LinkIndex
+from obsidian_publisher.core.slugs import parameterize
 from obsidian_publisher.images.optimizer import ImageOptimizer
 from obsidian_publisher.transforms.links import LinkTransform, relative_link
 from obsidian_publisher.transforms.tags import TagTransform
@@ -35,6 +35,8 @@ class PublisherConfig:
     max_image_width: int = 1920
     webp_quality: int = 85
     fail_fast: bool = False
+    cache_path: Optional[Path] = None
+    max_frontmatter_bytes: Optional[int] = None
 
 
 class Publisher:
@@ -79,6 +81,8 @@ class Publisher:
             required_tags=config.required_tags,
             excluded_tags=config.excluded_tags,
             fail_fast=config.fail_fast,
+            cache_path=config.cache_path,
+            max_frontmatter_bytes=config.max_frontmatter_bytes,
         )
 
         # Build link index
@@ -144,9 +148,14 @@ class Publisher:
         # Track all referenced images
         all_referenced_images: Set[str] = set()
 
-        for note in notes:
+        # Read and transform every note up front; writes stay sequential
+        processed_notes = self.processor.process_many(notes, return_exceptions=True)
+
+        for note, processed in zip(notes, processed_notes):
             try:
-                processed = self._publish_note(note, dry_run)
+                if isinstance(processed, Exception):
+                    raise processed
+                self._write_note(processed, dry_run)
                 all_referenced_images.update(processed.referenced_images)
                 result.published_titles.append(note.title)
             except Exception as e:
@@ -226,10 +235,10 @@ class Publisher:
                 slug = note.slug
                 title = note.title
             else:
-                slug = inflection.parameterize(path.stem)
+                slug = parameterize(path.stem)
                 title = path.stem
         else:
-            slug = inflection.parameterize(path.stem)
+            slug = parameterize(path.stem)
             title = path.stem
 
         published_file = self.content_output / f"{slug}.md"
@@ -258,28 +267,27 @@ class Publisher:
     def _get_existing_frontmatter(self, slug: str) -> Optional[Dict]:
         """Get the frontmatter from an existing published file.
 
+        Only the frontmatter bytes of the published file are read and
+        parsed, subject to the configured max_frontmatter_bytes cap.
+
         Args:
             slug: The note slug
 
         Returns:
             The existing frontmatter dict, or None if not found
         """
-        import yaml as yaml_lib
-
         output_file = self.content_output / f"{slug}.md"
         if not output_file.exists():
             return None
 
         try:
-            content = output_file.read_text(encoding='utf-8')
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 2:
-                    return yaml_lib.safe_load(parts[1])
+            frontmatter, _ = read_frontmatter(
+                output_file, self.config.max_frontmatter_bytes
+            )
         except Exception:
-            pass
+            return None
 
-        return None
+        return frontmatter or None
 
     def _format_date_value(self, date_val) -> Optional[str]:
         """Format a date value as a string.
@@ -308,8 +316,18 @@ class Publisher:
         Returns:
             ProcessedNote result
         """
-        # Process content
         processed = self.processor.process(note)
+        self._write_note(processed, dry_run)
+        return processed
+
+    def _write_note(self, processed: ProcessedNote, dry_run: bool) -> None:
+        """Write an already processed note and its images.
+
+        Args:
+            processed: ProcessedNote from the content processor
+            dry_run: If True, don't write files
+        """
+        note = processed.metadata
 
         # Preserve existing date fields if available
         existing_fm = self._get_existing_frontmatter(note.slug)
@@ -333,8 +351,6 @@ class Publisher:
         for image_name in processed.referenced_images:
             self._process_image(image_name, dry_run)
 
-        return processed
-
     def _process_image(self, image_name: str, dry_run: bool) -> None:
         """Process and copy an image to the output directory.
 
@@ -353,7 +369,7 @@ class Publisher:
 
         if self.optimizer:
             # Slugify the output name to match markdown references
-            output_name = inflection.parameterize(Path(image_name).stem)
+            output_name = parameterize(Path(image_name).stem)
             # Optimize and create WebP + PNG versions
             self.optimizer.optimize(
                 source_path,
@@ -412,11 +428,12 @@ class Publisher:
         return referenced
 
 
-def create_publisher_from_config(config_path: Path) -> Publisher:
+def create_publisher_from_config(config_path: Path, use_cache: bool = True) -> Publisher:
     """Create a Publisher from a YAML config file.
 
     Args:
         config_path: Path to config.yaml
+        use_cache: If False, ignore any configured cache_path
 
     Returns:
         Configured Publisher instance
@@ -438,6 +455,10 @@ def create_publisher_from_config(config_path: Path) -> Publisher:
     else:
         source_dirs = ['.']
 
+    cache_path = None
+    if use_cache and raw_config.get('cache_path'):
+        cache_path = Path(raw_config['cache_path']).expanduser()
+
     config = PublisherConfig(
         vault_path=vault_path,
         output_path=output_path,
@@ -451,6 +472,8 @@ def create_publisher_from_config(config_path: Path) -> Publisher:
         optimize_images=raw_config.get('optimize_images', True),
         max_image_width=raw_config.get('max_image_width', 1920),
         webp_quality=raw_config.get('webp_quality', 85),
+        cache_path=cache_path,
+        max_frontmatter_bytes=raw_config.get('max_frontmatter_bytes'),
     )
 
     # Build transforms based on config
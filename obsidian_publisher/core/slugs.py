@@ -0,0 +1,41 @@
+"""Slug generation shared by discovery and content processing."""
+
+import re
+from functools import lru_cache
+
+# Every ASCII character inflection.parameterize would turn into a separator
+_SEPARATOR_TABLE = str.maketrans({
+    chr(c): '-'
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in '-_')
+})
+
+_SEPARATOR_RUN_RE = re.compile(r'-{2,}')
+
+
+@lru_cache(maxsize=65536)
+def parameterize(text: str) -> str:
+    """Convert text to a URL slug, memoized.
+
+    Notes reference the same titles, images and sections over and over, and
+    inflection.parameterize is pure, so results are cached per process.
+    ASCII text (nearly every title) is slugified with a translate table,
+    producing exactly what inflection would without its three regex passes.
+
+    Args:
+        text: Text to slugify
+
+    Returns:
+        Slug string (e.g., "My Note" -> "my-note")
+    """
+    if text.isascii():
+        slug = text.translate(_SEPARATOR_TABLE)
+        # Most anchors and titles are single-spaced; skip the regex for them
+        if '--' in slug:
+            slug = _SEPARATOR_RUN_RE.sub('-', slug)
+        return slug.strip('-').lower()
+
+    # Deferred to the first non-ASCII miss to keep import time down
+    import inflection
+
+    return inflection.parameterize(text)
@@ -3,9 +3,10 @@
 from pathlib import Path
 from typing import List, Optional, Set, Tuple
 from PIL import Image
-import inflection
 import os
 
+from obsidian_publisher.core.slugs import parameterize
+
 
 class ImageOptimizer:
     """Optimizes images for web: resize, WebP conversion, PNG fallback.
@@ -146,13 +147,13 @@ class ImageOptimizer:
         ref_basenames = set()
         for img in referenced_images:
             # Slugify to match the output filenames
-            ref_basenames.add(inflection.parameterize(Path(img).stem))
+            ref_basenames.add(parameterize(Path(img).stem))
 
         orphans = []
         for img_path in image_dir.iterdir():
             if img_path.is_file() and img_path.suffix.lower() in {'.webp', '.png', '.jpg', '.jpeg', '.gif'}:
                 # Slugify disk filename stem to match against slugified references
-                disk_stem = inflection.parameterize(img_path.stem)
+                disk_stem = parameterize(img_path.stem)
                 if disk_stem not in ref_basenames:
                     orphans.append(img_path)
 
@@ -4,7 +4,6 @@ These factories create transform functions that process note frontmatter
 for output to various static site generators.
 """
 
-import titlecase as tc
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -70,6 +69,9 @@ def hugo_frontmatter(author: Optional[str] = None) -> FrontmatterTransform:
     Returns:
         A transform function for Hugo frontmatter
     """
+    # Deferred so importing the transforms package stays cheap
+    import titlecase as tc
+
     def transform(fm: Dict[str, Any], processed: "ProcessedNote") -> Dict[str, Any]:
         meta = processed.metadata
         # Semicolons in titles break YAML parsing, replace with colons
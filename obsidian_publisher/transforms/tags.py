@@ -3,7 +3,7 @@
 These factories create transform functions that filter and modify tag lists.
 """
 
-from typing import Callable, List
+from typing import Callable, List, Sequence
 
 TagTransform = Callable[[List[str]], List[str]]
 
@@ -32,7 +32,9 @@ def filter_by_prefix(*prefixes: str) -> TagTransform:
         ["domain/cs", "type/post"]
     """
     def transform(tags: List[str]) -> List[str]:
-        return [t for t in tags if any(t.startswith(p) for p in prefixes)]
+        # str.startswith checks a tuple of prefixes in one C call
+        return [t for t in tags if t.startswith(prefixes)]
+    transform._prefixes = prefixes
     return transform
 
 
@@ -55,6 +57,7 @@ def replace_separator(old: str = "/", new: str = "-") -> TagTransform:
     """
     def transform(tags: List[str]) -> List[str]:
         return [t.replace(old, new) for t in tags]
+    transform._separator = (old, new)
     return transform
 
 
@@ -71,7 +74,9 @@ def compose(*transforms: TagTransform) -> TagTransform:
     """Chain multiple tag transforms together.
 
     Transforms are applied in order, with each transform receiving
-    the output of the previous one.
+    the output of the previous one. Nested compositions are flattened, and a
+    filter_by_prefix followed directly by replace_separator is fused into a
+    single pass over the tags.
 
     Args:
         *transforms: Transform functions to chain
@@ -88,9 +93,44 @@ def compose(*transforms: TagTransform) -> TagTransform:
         >>> transform(["status/ok", "domain/b", "domain/a"])
         ["domain-a", "domain-b"]
     """
+    stages = _fuse(transforms)
+
     def transform(tags: List[str]) -> List[str]:
         result = tags
-        for t in transforms:
+        for t in stages:
             result = t(result)
         return result
+    transform._stages = stages
+    return transform
+
+
+def _fuse(transforms: Sequence[TagTransform]) -> List[TagTransform]:
+    """Flatten nested compositions and fuse filter/replace pairs.
+
+    Args:
+        transforms: Transform functions in application order
+
+    Returns:
+        Equivalent list of transforms with fewer passes over the tags
+    """
+    flat: List[TagTransform] = []
+    for t in transforms:
+        flat.extend(getattr(t, '_stages', (t,)))
+
+    stages: List[TagTransform] = []
+    for t in flat:
+        previous = stages[-1] if stages else None
+        prefixes = getattr(previous, '_prefixes', None)
+        separator = getattr(t, '_separator', None)
+        if prefixes is not None and separator is not None:
+            stages[-1] = _filter_and_replace(prefixes, *separator)
+        else:
+            stages.append(t)
+    return stages
+
+
+def _filter_and_replace(prefixes: tuple, old: str, new: str) -> TagTransform:
+    """Create the fused form of filter_by_prefix then replace_separator."""
+    def transform(tags: List[str]) -> List[str]:
+        return [t.replace(old, new) for t in tags if t.startswith(prefixes)]
     return transform
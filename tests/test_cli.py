@@ -94,6 +94,34 @@ required_tags:
         content_dir = temp_output / "content/posts"
         assert not content_dir.exists() or len(list(content_dir.glob("*.md"))) == 0
 
+    def test_republish_writes_configured_cache(self, temp_vault, temp_output):
+        cache_path = temp_output / "cache" / "metadata.pickle"
+        config_path = temp_vault / "config.yaml"
+        config_path.write_text(f"""
+vault_path: {temp_vault}
+output_path: {temp_output}
+cache_path: {cache_path}
+""")
+        runner = CliRunner()
+        result = runner.invoke(cli, ['republish', '-c', str(config_path)])
+
+        assert result.exit_code == 0
+        assert cache_path.exists()
+
+    def test_republish_no_cache(self, temp_vault, temp_output):
+        cache_path = temp_output / "cache" / "metadata.pickle"
+        config_path = temp_vault / "config.yaml"
+        config_path.write_text(f"""
+vault_path: {temp_vault}
+output_path: {temp_output}
+cache_path: {cache_path}
+""")
+        runner = CliRunner()
+        result = runner.invoke(cli, ['republish', '-c', str(config_path), '--no-cache'])
+
+        assert result.exit_code == 0
+        assert not cache_path.exists()
+
     def test_add(self, config_file, temp_vault, temp_output):
         runner = CliRunner()
         result = runner.invoke(cli, ['add', str(temp_vault / "note.md"), '-c', str(config_file)])
@@ -1,25 +1,23 @@
 """Tests for VaultDiscovery class."""
 
-import pytest
+import dataclasses
+import datetime
+import pickle
+import random
+import sys
 from pathlib import Path
-import tempfile
-import shutil
 
-from obsidian_publisher.core.discovery import VaultDiscovery
+import pytest
 
+from obsidian_publisher.core.discovery import VaultDiscovery
+from obsidian_publisher.core.models import NoteContext, NoteMetadata
 
-class TestVaultDiscovery:
-    """Tests for VaultDiscovery class."""
 
-    @pytest.fixture
-    def temp_vault(self):
-        """Create a temporary vault with test notes."""
-        temp_dir = tempfile.mkdtemp()
-        vault_path = Path(temp_dir)
-
-        # Create a simple note with tags
-        note1 = vault_path / "note1.md"
-        note1.write_text("""---
+def _populate_vault(vault_path: Path) -> Path:
+    """Write the standard four-note test vault into vault_path."""
+    # Create a simple note with tags
+    note1 = vault_path / "note1.md"
+    note1.write_text("""---
 title: Test Note One
 tags:
   - evergreen
@@ -33,9 +31,9 @@ date: 2024-01-15
 This is test content.
 """)
 
-        # Create note with excluded tag
-        note2 = vault_path / "note2.md"
-        note2.write_text("""---
+    # Create note with excluded tag
+    note2 = vault_path / "note2.md"
+    note2.write_text("""---
 title: Draft Note
 tags:
   - draft
@@ -45,16 +43,16 @@ tags:
 # Draft content
 """)
 
-        # Create note without frontmatter
-        note3 = vault_path / "note3.md"
-        note3.write_text("""# No Frontmatter
+    # Create note without frontmatter
+    note3 = vault_path / "note3.md"
+    note3.write_text("""# No Frontmatter
 
 Just plain content.
 """)
 
-        # Create note with string tag
-        note4 = vault_path / "note4.md"
-        note4.write_text("""---
+    # Create note with string tag
+    note4 = vault_path / "note4.md"
+    note4.write_text("""---
 title: Single Tag Note
 tags: evergreen
 ---
@@ -62,19 +60,32 @@ tags: evergreen
 Content here.
 """)
 
-        yield vault_path
+    return vault_path
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
 
-    def test_discover_all_finds_notes(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
+@pytest.fixture(scope="module")
+def readonly_vault(tmp_path_factory):
+    """Standard vault shared by every test that only reads it."""
+    return _populate_vault(tmp_path_factory.mktemp("vault"))
+
+
+@pytest.fixture
+def mutable_vault(tmp_path):
+    """Fresh copy of the standard vault for tests that add files."""
+    return _populate_vault(tmp_path)
+
+
+class TestVaultDiscovery:
+    """Tests for VaultDiscovery class."""
+
+    def test_discover_all_finds_notes(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
         notes = discovery.discover_all()
         # Should find all 4 notes (no filtering)
         assert len(notes) == 4
 
-    def test_discover_with_required_tags(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, required_tags=["evergreen"])
+    def test_discover_with_required_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, required_tags=["evergreen"])
         notes = discovery.discover_all()
         # Should find note1 and note4 (both have evergreen tag)
         assert len(notes) == 2
@@ -82,17 +93,17 @@ Content here.
         assert "Test Note One" in titles
         assert "Single Tag Note" in titles
 
-    def test_discover_with_excluded_tags(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, excluded_tags=["draft"])
+    def test_discover_with_excluded_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, excluded_tags=["draft"])
         notes = discovery.discover_all()
         # Should exclude note2 (has draft tag)
         assert len(notes) == 3
         titles = {n.title for n in notes}
         assert "Draft Note" not in titles
 
-    def test_discover_with_both_filters(self, temp_vault):
+    def test_discover_with_both_filters(self, readonly_vault):
         discovery = VaultDiscovery(
-            temp_vault,
+            readonly_vault,
             required_tags=["evergreen"],
             excluded_tags=["draft"]
         )
@@ -100,41 +111,41 @@ Content here.
         # Should find note1 and note4 (evergreen, not draft)
         assert len(notes) == 2
 
-    def test_get_note_metadata_by_path(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
-        note = discovery.get_note_metadata(temp_vault / "note1.md")
+    def test_get_note_metadata_by_path(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
         assert note is not None
         assert note.title == "Test Note One"
 
-    def test_get_note_metadata_not_found(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
-        note = discovery.get_note_metadata(temp_vault / "nonexistent.md")
+    def test_get_note_metadata_not_found(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "nonexistent.md")
         assert note is None
 
-    def test_is_publishable_with_required_tags(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, required_tags=["evergreen"])
-        note = discovery.get_note_metadata(temp_vault / "note1.md")
+    def test_is_publishable_with_required_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, required_tags=["evergreen"])
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
         is_pub, reason = discovery.is_publishable(note)
         assert is_pub is True
         assert reason == "OK"
 
-    def test_is_publishable_missing_required_tags(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, required_tags=["evergreen"])
-        note = discovery.get_note_metadata(temp_vault / "note2.md")
+    def test_is_publishable_missing_required_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, required_tags=["evergreen"])
+        note = discovery.get_note_metadata(readonly_vault / "note2.md")
         is_pub, reason = discovery.is_publishable(note)
         assert is_pub is False
         assert "Missing required tags" in reason
 
-    def test_is_publishable_has_excluded_tags(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, excluded_tags=["draft"])
-        note = discovery.get_note_metadata(temp_vault / "note2.md")
+    def test_is_publishable_has_excluded_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, excluded_tags=["draft"])
+        note = discovery.get_note_metadata(readonly_vault / "note2.md")
         is_pub, reason = discovery.is_publishable(note)
         assert is_pub is False
         assert "excluded tags" in reason
 
-    def test_note_metadata_has_correct_fields(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
-        note = discovery.get_note_metadata(temp_vault / "note1.md")
+    def test_note_metadata_has_correct_fields(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
 
         assert note.title == "Test Note One"
         assert note.slug == "test-note-one"
@@ -145,9 +156,9 @@ Content here.
         # Content is accessed via lazy loading
         assert "# Test Note One" in note.context.read_raw()
 
-    def test_note_without_frontmatter(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
-        note = discovery.get_note_metadata(temp_vault / "note3.md")
+    def test_note_without_frontmatter(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note3.md")
 
         assert note is not None
         assert note.title == "note3"  # Falls back to filename
@@ -155,8 +166,24 @@ Content here.
         # Content is accessed via lazy loading
         assert "# No Frontmatter" in note.context.read_raw()
 
-    def test_source_dirs_subdirectory(self, temp_vault):
-        subdir = temp_vault / "posts"
+    def test_body_offset_skips_frontmatter(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
+
+        body = note.context.read_body()
+        assert body.lstrip().startswith("# Test Note One")
+        assert "title:" not in body
+
+    def test_body_offset_unknown_for_crlf_header(self, mutable_vault):
+        note_path = mutable_vault / "crlf.md"
+        note_path.write_bytes(b"---\r\ntitle: CRLF\r\n---\r\nBody\r\n")
+
+        note = VaultDiscovery(mutable_vault).get_note_metadata(note_path)
+
+        assert note.context.body_offset is None
+
+    def test_source_dirs_subdirectory(self, mutable_vault):
+        subdir = mutable_vault / "posts"
         subdir.mkdir()
         (subdir / "post1.md").write_text("""---
 title: Post One
@@ -167,14 +194,14 @@ tags:
 Post content.
 """)
 
-        discovery = VaultDiscovery(temp_vault, source_dirs=["posts"])
+        discovery = VaultDiscovery(mutable_vault, source_dirs=["posts"])
         notes = discovery.discover_all()
 
         assert len(notes) == 1
         assert notes[0].title == "Post One"
 
-    def test_source_dirs_multiple(self, temp_vault):
-        posts = temp_vault / "posts"
+    def test_source_dirs_multiple(self, mutable_vault):
+        posts = mutable_vault / "posts"
         posts.mkdir()
         (posts / "post1.md").write_text("""---
 title: Post One
@@ -183,7 +210,7 @@ tags:
 ---
 """)
 
-        projects = temp_vault / "projects"
+        projects = mutable_vault / "projects"
         projects.mkdir()
         (projects / "project1.md").write_text("""---
 title: Project One
@@ -192,20 +219,26 @@ tags:
 ---
 """)
 
-        discovery = VaultDiscovery(temp_vault, source_dirs=["posts", "projects"])
+        discovery = VaultDiscovery(mutable_vault, source_dirs=["posts", "projects"])
         notes = discovery.discover_all()
 
         assert len(notes) == 2
         titles = {n.title for n in notes}
         assert titles == {"Post One", "Project One"}
 
-    def test_source_dirs_not_found(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault, source_dirs=["nonexistent"])
+    def test_source_dirs_not_found(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault, source_dirs=["nonexistent"])
         with pytest.raises(FileNotFoundError):
             discovery.discover_all()
 
-    def test_source_dirs_partial_missing(self, temp_vault):
-        posts = temp_vault / "posts"
+    def test_source_dir_that_is_a_file(self, mutable_vault):
+        (mutable_vault / "posts").write_text("not a directory")
+        discovery = VaultDiscovery(mutable_vault, source_dirs=["posts"])
+        with pytest.raises(FileNotFoundError):
+            discovery.discover_all()
+
+    def test_source_dirs_partial_missing(self, mutable_vault):
+        posts = mutable_vault / "posts"
         posts.mkdir()
         (posts / "post1.md").write_text("""---
 title: Post One
@@ -214,28 +247,41 @@ tags:
 ---
 """)
 
-        discovery = VaultDiscovery(temp_vault, source_dirs=["posts", "nonexistent"])
+        discovery = VaultDiscovery(mutable_vault, source_dirs=["posts", "nonexistent"])
         notes = discovery.discover_all()
 
         assert len(notes) == 1
         assert notes[0].title == "Post One"
 
-    def test_string_tag_format(self, temp_vault):
-        discovery = VaultDiscovery(temp_vault)
-        note = discovery.get_note_metadata(temp_vault / "note4.md")
+    def test_string_tag_format(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note4.md")
 
         assert note is not None
         assert "evergreen" in note.tags
 
+    def test_tag_set_mirrors_tags(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
+
+        assert note.tag_set == frozenset(note.tags)
+        assert isinstance(note.tags, list)
+
+    def test_metadata_is_frozen(self, readonly_vault):
+        discovery = VaultDiscovery(readonly_vault)
+        note = discovery.get_note_metadata(readonly_vault / "note1.md")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            note.title = "Changed"
+        assert pickle.loads(pickle.dumps(note)) == note
+
 
 class TestFrontmatterParsing:
     """Tests for frontmatter parsing edge cases."""
 
     @pytest.fixture
-    def temp_vault(self):
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def temp_vault(self, tmp_path):
+        return tmp_path
 
     def test_malformed_yaml(self, temp_vault):
         note = temp_vault / "bad.md"
@@ -289,15 +335,156 @@ Content.
         assert "2024" in result.creation_date
         assert "2024-02-01" in result.publication_date
 
+    def test_crlf_frontmatter(self, temp_vault):
+        note = temp_vault / "crlf.md"
+        note.write_bytes(b"---\r\ntitle: Windows Note\r\ntags: [evergreen]\r\n---\r\nBody\r\n")
+
+        discovery = VaultDiscovery(temp_vault)
+        result = discovery.get_note_metadata(note)
+
+        assert result.title == "Windows Note"
+        assert result.tags == ["evergreen"]
+
+    def test_frontmatter_spanning_chunks(self, temp_vault):
+        note = temp_vault / "long.md"
+        filler = "x" * (VaultDiscovery.HEADER_CHUNK_BYTES * 2)
+        note.write_text(f"""---
+summary: {filler}
+title: Long Header
+---
+Content.
+""")
+
+        discovery = VaultDiscovery(temp_vault)
+        result = discovery.get_note_metadata(note)
+
+        assert result.title == "Long Header"
+
+    def test_frontmatter_over_size_cap(self, temp_vault):
+        note = temp_vault / "huge.md"
+        filler = "x" * VaultDiscovery.MAX_FRONTMATTER_BYTES
+        note.write_text(f"""---
+title: Huge
+summary: {filler}
+---
+
+Content.
+""")
+
+        discovery = VaultDiscovery(temp_vault)
+        result = discovery.get_note_metadata(note)
+
+        # Treated like an unclosed header rather than scanning the whole file
+        assert result is not None
+        assert result.title == "huge"
+
+    def test_configurable_size_cap(self, temp_vault):
+        note = temp_vault / "medium.md"
+        note.write_text(f"""---
+title: Medium
+summary: {"x" * 200}
+---
+
+Content.
+""")
+
+        small = VaultDiscovery(temp_vault, max_frontmatter_bytes=128)
+        default = VaultDiscovery(temp_vault)
+
+        assert small.get_note_metadata(note).title == "medium"
+        assert default.get_note_metadata(note).title == "Medium"
+
+
+class TestDateString:
+    """Tests for date value normalization."""
+
+    def test_none(self):
+        assert VaultDiscovery._get_date_string(None) == ""
+
+    def test_string_passthrough(self):
+        assert VaultDiscovery._get_date_string("2024-01-15") == "2024-01-15"
+
+    def test_date(self):
+        assert VaultDiscovery._get_date_string(datetime.date(2024, 1, 15)) == "2024-01-15"
+
+    def test_date_before_year_1000(self):
+        value = datetime.date(999, 1, 1)
+        assert VaultDiscovery._get_date_string(value) == value.strftime('%Y-%m-%d')
+
+    def test_datetime(self):
+        value = datetime.datetime(2024, 1, 15, 10, 30, 0)
+        assert VaultDiscovery._get_date_string(value) == "2024-01-15 10:30:00"
+
+    def test_subclass_uses_parent_format(self):
+        class CustomDate(datetime.date):
+            pass
+
+        assert VaultDiscovery._get_date_string(CustomDate(2024, 1, 15)) == "2024-01-15"
+
+    def test_other_types_stringified(self):
+        assert VaultDiscovery._get_date_string(20240115) == "20240115"
+
+
+class TestExtractTags:
+    """Tests for tag normalization."""
+
+    @pytest.mark.parametrize("frontmatter,expected", [
+        ({"tags": ["a", "b/c"]}, ["a", "b/c"]),
+        ({"tags": "solo"}, ["solo"]),
+        ({"tags": [1, 2.5]}, ["1", "2.5"]),
+        ({"tags": None}, []),
+        ({"tags": {"nested": "map"}}, []),
+        ({}, []),
+    ])
+    def test_extract_tags(self, frontmatter, expected):
+        assert VaultDiscovery._extract_tags(frontmatter) == expected
+
+
+class TestTagFiltering:
+    """Tests for bulk tag filtering during discovery."""
+
+    @staticmethod
+    def _note(name, tags):
+        return NoteMetadata(
+            context=NoteContext(path=Path(f"{name}.md")),
+            title=name,
+            slug=name,
+            frontmatter={},
+            tags=tags,
+            creation_date="",
+            publication_date="",
+        )
+
+    def test_select_publishable_matches_is_publishable(self, tmp_path):
+        rng = random.Random(0)
+        pool = ["evergreen", "draft", "private", "domain/cs", "domain/math"]
+        notes = [
+            self._note(f"n{i}", rng.sample(pool, rng.randint(0, 3)))
+            for i in range(200)
+        ]
+        discovery = VaultDiscovery(
+            tmp_path,
+            required_tags=["evergreen", "domain/cs"],
+            excluded_tags=["draft", "private"],
+        )
+
+        expected = [n for n in notes if discovery.is_publishable(n)[0]]
+
+        assert discovery._select_publishable(notes) == expected
+
+    def test_select_publishable_without_filters(self, tmp_path):
+        notes = [self._note("a", []), self._note("b", ["draft"])]
+        discovery = VaultDiscovery(tmp_path)
+
+        assert discovery._select_publishable(notes) == notes
+
 
 class TestErrorHandling:
     """Tests for error handling and collection."""
 
     @pytest.fixture
-    def temp_vault(self):
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def temp_vault(self, tmp_path):
+        return tmp_path
 
     def test_errors_collected_during_discover_all(self, temp_vault):
         (temp_vault / "good.md").write_text("""---
@@ -354,3 +541,153 @@ Content.
 
         assert len(notes) == 1
         assert len(discovery.errors) == 2
+
+
+class TestParallelDiscovery:
+    """Tests for the process pool discovery path."""
+
+    @pytest.fixture
+    def large_vault(self, tmp_path):
+        vault_path = tmp_path
+        for i in range(VaultDiscovery.PARALLEL_THRESHOLD + 6):
+            tag = "evergreen" if i % 2 == 0 else "draft"
+            (vault_path / f"note{i}.md").write_text(f"""---
+title: Note {i}
+tags:
+  - {tag}
+---
+Content {i}.
+""")
+        (vault_path / "bad.md").write_text("""---
+tags: [unclosed
+---
+""")
+        return vault_path
+
+    def test_parallel_matches_sequential(self, large_vault):
+        parallel = VaultDiscovery(large_vault, required_tags=["evergreen"])
+        notes = parallel.discover_all()
+
+        sequential = VaultDiscovery(large_vault, required_tags=["evergreen"])
+        expected = [n for n in (sequential.get_note_metadata(p) for p in large_vault.glob("*.md")) if n]
+        expected = [n for n in expected if sequential.is_publishable(n)[0]]
+
+        assert sorted(n.title for n in notes) == sorted(n.title for n in expected)
+        assert len(notes) == (VaultDiscovery.PARALLEL_THRESHOLD + 6) // 2
+
+    def test_parallel_collects_errors(self, large_vault):
+        discovery = VaultDiscovery(large_vault)
+        discovery.discover_all()
+
+        assert len(discovery.errors) == 1
+        assert discovery.errors[0].path.name == "bad.md"
+
+    def test_parallel_fail_fast(self, large_vault):
+        discovery = VaultDiscovery(large_vault, fail_fast=True)
+
+        with pytest.raises(Exception):
+            discovery.discover_all()
+
+
+class TestMetadataCache:
+    """Tests for the on-disk metadata cache."""
+
+    @pytest.fixture
+    def temp_vault(self, tmp_path):
+        vault_path = tmp_path
+        (vault_path / "note.md").write_text("""---
+title: Cached Note
+tags:
+  - evergreen
+---
+Content.
+""")
+        return vault_path
+
+    def test_cache_written_after_discover(self, temp_vault):
+        cache_path = temp_vault / ".cache" / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        assert cache_path.exists()
+
+    def test_cache_hit_skips_parsing(self, temp_vault, monkeypatch):
+        cache_path = temp_vault / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        def fail(file_path, max_frontmatter_bytes=None):
+            raise AssertionError("note should not be re-parsed")
+
+        monkeypatch.setattr(VaultDiscovery, "_parse_note", staticmethod(fail))
+        notes = VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        assert [n.title for n in notes] == ["Cached Note"]
+
+    def test_cache_invalidated_on_change(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        (temp_vault / "note.md").write_text("""---
+title: Renamed Note
+---
+Changed content.
+""")
+        notes = VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        assert [n.title for n in notes] == ["Renamed Note"]
+
+    def test_cached_tags_are_interned(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        notes = VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        tag = notes[0].tags[0]
+        assert tag is sys.intern(tag)
+        assert all(t is sys.intern(t) for t in notes[0].tag_set)
+
+    def test_unchanged_vault_does_not_rewrite_cache(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+        written = cache_path.stat().st_mtime_ns
+
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        assert cache_path.stat().st_mtime_ns == written
+
+    def test_pruned_entries_rewrite_cache(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        (temp_vault / "extra.md").write_text("---\ntitle: Extra\n---\n")
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+        (temp_vault / "extra.md").unlink()
+
+        discovery = VaultDiscovery(temp_vault, cache_path=cache_path)
+        discovery.discover_all()
+
+        reloaded = VaultDiscovery(temp_vault, cache_path=cache_path)
+        assert not any(k.endswith("extra.md") for k in reloaded._cache)
+
+    def test_cache_from_other_version_ignored(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        cache_path.write_bytes(pickle.dumps({"version": -1, "notes": {"x": "stale"}}))
+        discovery = VaultDiscovery(temp_vault, cache_path=cache_path)
+
+        assert discovery._cache == {}
+        assert [n.title for n in discovery.discover_all()] == ["Cached Note"]
+
+    def test_cache_from_other_size_cap_ignored(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        discovery = VaultDiscovery(
+            temp_vault, cache_path=cache_path, max_frontmatter_bytes=16
+        )
+
+        assert discovery._cache == {}
+
+    def test_corrupt_cache_ignored(self, temp_vault):
+        cache_path = temp_vault / "metadata.pickle"
+        cache_path.write_bytes(b"not a pickle")
+
+        notes = VaultDiscovery(temp_vault, cache_path=cache_path).discover_all()
+
+        assert [n.title for n in notes] == ["Cached Note"]
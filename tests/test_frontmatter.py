@@ -0,0 +1,34 @@
+"""Tests for shared frontmatter splitting."""
+
+import yaml
+
+from obsidian_publisher.core.frontmatter import SafeLoader, split_frontmatter
+
+
+class TestSplitFrontmatter:
+    """Tests for split_frontmatter()."""
+
+    def test_header_and_body(self):
+        header, body = split_frontmatter("---\ntitle: A\n---\nBody\n")
+        assert header == "title: A\n"
+        assert body == "Body\n"
+
+    def test_no_frontmatter(self):
+        assert split_frontmatter("# Heading\n") == (None, "# Heading\n")
+
+    def test_unclosed_header(self):
+        text = "---\ntitle: A\nBody\n"
+        assert split_frontmatter(text) == (None, text)
+
+    def test_matches_split(self):
+        text = "---\na: 1\n---\nbody with ---\n and more\n"
+        header, body = split_frontmatter(text)
+        assert [header, body] == text.split("---\n", 2)[1:]
+
+
+class TestYamlLoader:
+    """Tests for the shared YAML loader."""
+
+    def test_loads_like_safe_load(self):
+        text = "title: Rust 🦀\ntags:\n  - a/b\n  - c\ndraft: false\n"
+        assert yaml.load(text, Loader=SafeLoader) == yaml.safe_load(text)
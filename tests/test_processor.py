@@ -1,10 +1,11 @@
 """Tests for ContentProcessor class."""
 
+import dataclasses
+
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
 
+from obsidian_publisher.core.discovery import VaultDiscovery
 from obsidian_publisher.core.processor import ContentProcessor, LinkIndex
 from obsidian_publisher.core.models import NoteContext, NoteMetadata
 from obsidian_publisher.transforms.links import relative_link, absolute_link, hugo_ref
@@ -69,17 +70,25 @@ class TestLinkIndex:
 
         assert index.get_slug("Nonexistent") is None
 
+    def test_case_folded_lookup(self):
+        index = LinkIndex.from_dict({"Straße": "strasse"})
+
+        assert index.get_slug("STRASSE") == "strasse"
+        assert index.get_slug("straße") == "strasse"
+
+    def test_repeated_lookups_memoized(self):
+        index = LinkIndex.from_dict({"My Note": "my-note"})
+
+        assert index.get_slug("my note") == "my-note"
+        assert index.get_slug("Missing") is None
+        assert index._memo == {"my note": "my-note", "Missing": None}
+        assert index.get_slug("Missing") is None
+
 
 class TestContentProcessor:
     """Tests for ContentProcessor class."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def link_index(self):
         return LinkIndex.from_dict({
             "First Note": "first-note",
@@ -87,7 +96,16 @@ class TestContentProcessor:
             "Note With Spaces": "note-with-spaces",
         })
 
-    def _create_note(self, temp_dir: Path, content: str, title: str = "Test Note") -> NoteMetadata:
+    @pytest.fixture(scope="module")
+    def processor(self, link_index):
+        # LinkIndex and the processor are only read, so one of each serves
+        # every test in the module
+        return ContentProcessor(
+            link_index=link_index,
+            link_transform=relative_link(),
+        )
+
+    def _create_note(self, tmp_path: Path, content: str, title: str = "Test Note") -> NoteMetadata:
         """Helper to create a NoteMetadata with a real file."""
         frontmatter = f"""---
 title: {title}
@@ -98,7 +116,7 @@ created: 2024-01-01 00:00:00+0000
 date: 2024-01-15 00:00:00+0000
 ---
 """
-        file_path = temp_dir / f"{title.lower().replace(' ', '-')}.md"
+        file_path = tmp_path / f"{title.lower().replace(' ', '-')}.md"
         file_path.write_text(frontmatter + content)
 
         return NoteMetadata(
@@ -111,69 +129,57 @@ date: 2024-01-15 00:00:00+0000
             publication_date="2024-01-15 00:00:00+0000",
         )
 
-    def test_simple_wikilink_conversion(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "Check out [[First Note]] for more info.")
+    def test_simple_wikilink_conversion(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "Check out [[First Note]] for more info.")
 
         result = processor.process(note)
 
         assert "[First Note](first-note.md)" in result.content
 
-    def test_wikilink_with_display_text(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "See [[First Note|this article]] here.")
+    def test_wikilink_with_display_text(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "See [[First Note|this article]] here.")
 
         result = processor.process(note)
 
         assert "[this article](first-note.md)" in result.content
 
-    def test_wikilink_with_absolute_link_transform(self, link_index, temp_dir):
+    def test_wikilink_with_absolute_link_transform(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=absolute_link("/blog"),
         )
-        note = self._create_note(temp_dir, "Read [[First Note]].")
+        note = self._create_note(tmp_path, "Read [[First Note]].")
 
         result = processor.process(note)
 
         assert "[First Note](/blog/first-note)" in result.content
 
-    def test_wikilink_with_hugo_ref_transform(self, link_index, temp_dir):
+    def test_wikilink_with_hugo_ref_transform(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=hugo_ref(),
         )
-        note = self._create_note(temp_dir, "Read [[First Note]].")
+        note = self._create_note(tmp_path, "Read [[First Note]].")
 
         result = processor.process(note)
 
         assert '[First Note]({{< ref "first-note" >}})' in result.content
 
-    def test_multiple_wikilinks(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "See [[First Note]] and [[Second Note]].")
+    def test_multiple_wikilinks(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "See [[First Note]] and [[Second Note]].")
 
         result = processor.process(note)
 
         assert "[First Note](first-note.md)" in result.content
         assert "[Second Note](second-note.md)" in result.content
 
-    def test_missing_link_tracked(self, link_index, temp_dir):
+    def test_missing_link_tracked(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=relative_link(),
             warn_on_missing_link=True,
         )
-        note = self._create_note(temp_dir, "See [[Nonexistent Note]].")
+        note = self._create_note(tmp_path, "See [[Nonexistent Note]].")
 
         result = processor.process(note)
 
@@ -181,35 +187,36 @@ date: 2024-01-15 00:00:00+0000
         # Should still generate a link using the parameterized slug
         assert "[Nonexistent Note](nonexistent-note.md)" in result.content
 
-    def test_section_link(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
+    def test_missing_links_deduplicated(self, processor, tmp_path):
+        note = self._create_note(
+            tmp_path, "[[Ghost]], [[Other Ghost]], [[Ghost|again]] and [[Ghost#Part]]."
         )
-        note = self._create_note(temp_dir, "See [[First Note#Introduction]].")
+
+        result = processor.process(note)
+
+        assert result.missing_links == ["Ghost", "Other Ghost"]
+
+    def test_section_link(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "See [[First Note#Introduction]].")
 
         result = processor.process(note)
 
         assert "[First Note](first-note.md#introduction)" in result.content
 
-    def test_section_link_with_display_text(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "See [[First Note#Section|the section]].")
+    def test_section_link_with_display_text(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "See [[First Note#Section|the section]].")
 
         result = processor.process(note)
 
         assert "[the section](first-note.md#section)" in result.content
 
-    def test_image_embed_conversion(self, link_index, temp_dir):
+    def test_image_embed_conversion(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=relative_link(),
             image_path_prefix="/images",
         )
-        note = self._create_note(temp_dir, "Here's an image: ![[diagram.png]]")
+        note = self._create_note(tmp_path, "Here's an image: ![[diagram.png]]")
 
         result = processor.process(note)
 
@@ -217,13 +224,13 @@ date: 2024-01-15 00:00:00+0000
         assert "![diagram](/images/diagram.png)" in result.content
         assert "diagram.png" in result.referenced_images
 
-    def test_image_embed_with_alt_text(self, link_index, temp_dir):
+    def test_image_embed_with_alt_text(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=relative_link(),
             image_path_prefix="/img",
         )
-        note = self._create_note(temp_dir, "![[photo.jpg|My vacation photo]]")
+        note = self._create_note(tmp_path, "![[photo.jpg|My vacation photo]]")
 
         result = processor.process(note)
 
@@ -231,19 +238,24 @@ date: 2024-01-15 00:00:00+0000
         assert "![my-vacation-photo](/img/photo.jpg)" in result.content
         assert "photo.jpg" in result.referenced_images
 
-    def test_multiple_images(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "![[img1.png]] and ![[img2.jpg]]")
+    def test_multiple_images(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "![[img1.png]] and ![[img2.jpg]]")
 
         result = processor.process(note)
 
         assert "img1.png" in result.referenced_images
         assert "img2.jpg" in result.referenced_images
 
-    def test_tag_transform(self, link_index, temp_dir):
+    def test_repeated_images_listed_once_in_order(self, processor, tmp_path):
+        note = self._create_note(
+            tmp_path, "![[b.png]] ![[a.png]] ![[b.png|again]] ![[c.png]] ![[a.png]]"
+        )
+
+        result = processor.process(note)
+
+        assert result.referenced_images == ["b.png", "a.png", "c.png"]
+
+    def test_tag_transform(self, link_index, tmp_path):
         tag_transform = compose(
             filter_by_prefix("domain"),
             replace_separator("/", "-")
@@ -253,14 +265,14 @@ date: 2024-01-15 00:00:00+0000
             link_transform=relative_link(),
             tag_transform=tag_transform,
         )
-        note = self._create_note(temp_dir, "Some content")
+        note = self._create_note(tmp_path, "Some content")
 
         result = processor.process(note)
 
         # The processed tags should be in ProcessedNote.tags
         assert result.tags == ["domain-cs"]
 
-    def test_frontmatter_transform(self, link_index, temp_dir):
+    def test_frontmatter_transform(self, link_index, tmp_path):
         tag_transform = compose(
             filter_by_prefix("domain"),
             replace_separator("/", "-")
@@ -272,7 +284,7 @@ date: 2024-01-15 00:00:00+0000
             tag_transform=tag_transform,
             frontmatter_transform=fm_transform,
         )
-        note = self._create_note(temp_dir, "Some content")
+        note = self._create_note(tmp_path, "Some content")
 
         result = processor.process(note)
 
@@ -280,12 +292,8 @@ date: 2024-01-15 00:00:00+0000
         assert result.frontmatter["author"] == "Test Author"
         assert result.frontmatter["tags"] == ["domain-cs"]
 
-    def test_build_output_with_frontmatter(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "# Heading\n\nParagraph.")
+    def test_build_output_with_frontmatter(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "# Heading\n\nParagraph.")
 
         processed = processor.process(note)
         output = processor.build_output(processed)
@@ -294,13 +302,20 @@ date: 2024-01-15 00:00:00+0000
         assert "---\n# Heading" in output
         assert "Paragraph." in output
 
-    def test_build_output_empty_frontmatter(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
+    def test_build_output_keeps_emoji_literal(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "Body")
+        processed = processor.process(note)
+        processed.frontmatter = {"title": "Rust 🦀", "tags": ["lang/rust 🦀"]}
+
+        output = processor.build_output(processed)
+
+        assert "title: Rust 🦀\n" in output
+        assert "- lang/rust 🦀\n" in output
+        assert "\\U0001F980" not in output
+
+    def test_build_output_empty_frontmatter(self, processor, tmp_path):
         # Create a note file with empty frontmatter
-        file_path = temp_dir / "empty-fm.md"
+        file_path = tmp_path / "empty-fm.md"
         file_path.write_text("Just content")
 
         note = NoteMetadata(
@@ -319,11 +334,7 @@ date: 2024-01-15 00:00:00+0000
         # Empty frontmatter should not be rendered
         assert output == "Just content\n"
 
-    def test_preserves_code_blocks(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
+    def test_preserves_code_blocks(self, processor, tmp_path):
         content = """
 ```python
 # This is [[not a link]]
@@ -331,7 +342,7 @@ print("hello")
 ```
 And [[First Note]] is a link.
 """
-        note = self._create_note(temp_dir, content)
+        note = self._create_note(tmp_path, content)
 
         result = processor.process(note)
 
@@ -339,7 +350,7 @@ And [[First Note]] is a link.
         # (code block preservation would require more sophisticated parsing)
         assert "[First Note](first-note.md)" in result.content
 
-    def test_complex_document(self, link_index, temp_dir):
+    def test_complex_document(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=absolute_link("/posts"),
@@ -354,7 +365,7 @@ This document discusses [[First Note]] and shows this diagram:
 
 For more details, see [[Second Note#Details|the details section]].
 """
-        note = self._create_note(temp_dir, content)
+        note = self._create_note(tmp_path, content)
 
         result = processor.process(note)
 
@@ -364,23 +375,79 @@ For more details, see [[Second Note#Details|the details section]].
         assert "[the details section](/posts/second-note#details)" in result.content
         assert "architecture.png" in result.referenced_images
 
+    def test_process_many_preserves_order(self, processor, tmp_path):
+        notes = [
+            self._create_note(tmp_path, f"Note {i} links [[First Note]].", title=f"Note {i}")
+            for i in range(20)
+        ]
+
+        results = processor.process_many(notes, max_workers=4)
+
+        assert [r.metadata.title for r in results] == [n.title for n in notes]
+        assert all("[First Note](first-note.md)" in r.content for r in results)
+
+    def test_process_many_small_batch_runs_inline(self, processor, tmp_path, monkeypatch):
+        import obsidian_publisher.core.processor as processor_module
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("thread pool should not be started")
+
+        monkeypatch.setattr(processor_module, "ThreadPoolExecutor", no_pool)
+        notes = [self._create_note(tmp_path, "See [[First Note]].", title="Small")]
+
+        results = processor.process_many(notes)
+
+        assert [r.metadata.title for r in results] == ["Small"]
+
+    def test_process_many_raises_by_default(self, processor, tmp_path):
+        missing = NoteMetadata(
+            context=NoteContext(path=tmp_path / "missing.md"),
+            title="Missing",
+            slug="missing",
+            frontmatter={},
+            tags=[],
+            creation_date="",
+            publication_date="",
+        )
+
+        with pytest.raises(FileNotFoundError):
+            processor.process_many([missing])
+
+    def test_process_many_return_exceptions(self, processor, tmp_path):
+        good = self._create_note(tmp_path, "Fine.", title="Good")
+        missing = NoteMetadata(
+            context=NoteContext(path=tmp_path / "missing.md"),
+            title="Missing",
+            slug="missing",
+            frontmatter={},
+            tags=[],
+            creation_date="",
+            publication_date="",
+        )
+
+        results = processor.process_many([good, missing], return_exceptions=True)
+
+        assert results[0].content.strip() == "Fine."
+        assert isinstance(results[1], FileNotFoundError)
+
 
 class TestEdgeCases:
     """Tests for edge cases in content processing."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def link_index(self):
         return LinkIndex.from_dict({"Test Note": "test-note"})
 
-    def _create_note(self, temp_dir: Path, content: str) -> NoteMetadata:
+    @pytest.fixture(scope="module")
+    def processor(self, link_index):
+        return ContentProcessor(
+            link_index=link_index,
+            link_transform=relative_link(),
+        )
+
+    def _create_note(self, tmp_path: Path, content: str) -> NoteMetadata:
         """Helper to create a NoteMetadata with a real file."""
-        file_path = temp_dir / "test.md"
+        file_path = tmp_path / "test.md"
         file_path.write_text(content)
 
         return NoteMetadata(
@@ -393,12 +460,8 @@ class TestEdgeCases:
             publication_date="",
         )
 
-    def test_empty_content(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "")
+    def test_empty_content(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "")
 
         result = processor.process(note)
 
@@ -406,12 +469,8 @@ class TestEdgeCases:
         assert result.referenced_images == []
         assert result.missing_links == []
 
-    def test_no_links_or_images(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "Just plain text with no special syntax.")
+    def test_no_links_or_images(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "Just plain text with no special syntax.")
 
         result = processor.process(note)
 
@@ -419,38 +478,88 @@ class TestEdgeCases:
         assert result.referenced_images == []
         assert result.missing_links == []
 
-    def test_nested_brackets(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "Text with [regular](markdown) links and [[Test Note]].")
+    def test_nested_brackets(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "Text with [regular](markdown) links and [[Test Note]].")
 
         result = processor.process(note)
 
         assert "[regular](markdown)" in result.content
         assert "[Test Note](test-note.md)" in result.content
 
-    def test_image_with_spaces_in_name(self, link_index, temp_dir):
+    def test_stray_brackets_before_image_embed(self, processor, tmp_path):
+        note = self._create_note(
+            tmp_path, "Type `[[` to open the link picker.\n\n![[diagram.png]]\n"
+        )
+
+        result = processor.process(note)
+
+        assert "Type `[[` to open the link picker." in result.content
+        assert "![diagram](/images/diagram.png)" in result.content
+        assert result.referenced_images == ["diagram.png"]
+
+    def test_stray_brackets_before_wikilink(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "An [[ unclosed bracket, then [[Test Note]].")
+
+        result = processor.process(note)
+
+        assert "An [[ unclosed bracket, then [Test Note](test-note.md)." in result.content
+
+    def test_image_with_spaces_in_name(self, link_index, tmp_path):
         processor = ContentProcessor(
             link_index=link_index,
             link_transform=relative_link(),
             image_path_prefix="/images",
         )
-        note = self._create_note(temp_dir, "![[my diagram.png]]")
+        note = self._create_note(tmp_path, "![[my diagram.png]]")
 
         result = processor.process(note)
 
         assert "my diagram.png" in result.referenced_images
 
-    def test_webp_and_svg_images(self, link_index, temp_dir):
-        processor = ContentProcessor(
-            link_index=link_index,
-            link_transform=relative_link(),
-        )
-        note = self._create_note(temp_dir, "![[photo.webp]] and ![[icon.svg]]")
+    def test_webp_and_svg_images(self, processor, tmp_path):
+        note = self._create_note(tmp_path, "![[photo.webp]] and ![[icon.svg]]")
 
         result = processor.process(note)
 
         assert "photo.webp" in result.referenced_images
         assert "icon.svg" in result.referenced_images
+
+
+class TestDiscoveredNotes:
+    """Process notes as VaultDiscovery hands them over, with a body offset."""
+
+    @pytest.fixture(scope="module")
+    def processor(self):
+        return ContentProcessor(
+            link_index=LinkIndex.from_dict({"Test Note": "test-note"}),
+            link_transform=relative_link(),
+        )
+
+    @pytest.mark.parametrize("raw", [
+        b"---\ntitle: LF\n---\nSee [[Test Note]] and ![[a.png]].\n",
+        b"---\r\ntitle: CRLF\r\n---\r\nSee [[Test Note]].\r\n\r\n![[a.png]]\r\n",
+        b"---\ntitle: CRLF body\n---\nLine one\r\nSee [[Test Note]]\r\n",
+        b"\xef\xbb\xbf---\ntitle: BOM\n---\nSee [[Test Note]].\n",
+        b"No frontmatter, just [[Test Note]].\n",
+        b"---\ntitle: Rule\n---\nAbove\n---\nBelow [[Test Note]]\n",
+    ], ids=["lf", "crlf", "crlf-body", "bom", "no-frontmatter", "body-rule"])
+    def test_matches_read_raw(self, processor, tmp_path, raw):
+        file_path = tmp_path / "note.md"
+        file_path.write_bytes(raw)
+        note = VaultDiscovery(tmp_path).get_note_metadata(file_path)
+        fallback = dataclasses.replace(note, context=NoteContext(path=file_path))
+
+        result = processor.process(note)
+        expected = processor.process(fallback)
+
+        assert result.content == expected.content
+        assert result.referenced_images == expected.referenced_images
+        assert result.missing_links == expected.missing_links
+
+    def test_lf_note_reads_body_from_offset(self, processor, tmp_path):
+        file_path = tmp_path / "note.md"
+        file_path.write_text("---\ntitle: LF\n---\nBody [[Test Note]]\n")
+        note = VaultDiscovery(tmp_path).get_note_metadata(file_path)
+
+        assert note.context.body_offset == len("---\ntitle: LF\n---\n")
+        assert processor.process(note).content == "Body [Test Note](test-note.md)\n"
@@ -306,6 +306,52 @@ Content here.
         assert "author: Test Author" in content
         assert "title: Test Note" in content
 
+    def test_republish_preserves_published_dates(self, temp_vault, temp_output):
+        config = PublisherConfig(
+            vault_path=temp_vault,
+            output_path=temp_output,
+            required_tags=["evergreen"],
+        )
+        publisher = Publisher(
+            config,
+            frontmatter_transform=hugo_frontmatter("Test Author"),
+        )
+        publisher.republish()
+
+        content_file = temp_output / "content/posts/test-note.md"
+        content = content_file.read_text()
+        content_file.write_text(content.replace("date: '2024-01-15'", "date: '2023-06-01'"))
+
+        publisher.republish()
+
+        assert "date: '2023-06-01'" in content_file.read_text()
+
+    def test_republish_reads_existing_frontmatter_up_to_configured_cap(
+        self, temp_vault, temp_output
+    ):
+        config = PublisherConfig(
+            vault_path=temp_vault,
+            output_path=temp_output,
+            required_tags=["evergreen"],
+            max_frontmatter_bytes=256 * 1024,
+        )
+        publisher = Publisher(
+            config,
+            frontmatter_transform=hugo_frontmatter("Test Author"),
+        )
+        publisher.republish()
+
+        # Pad the published header past the default 64KB scan limit
+        content_file = temp_output / "content/posts/test-note.md"
+        content = content_file.read_text()
+        content = content.replace("date: '2024-01-15'", "date: '2023-06-01'")
+        content = content.replace("---\n", "---\npadding: " + "x" * (100 * 1024) + "\n", 1)
+        content_file.write_text(content)
+
+        publisher.republish()
+
+        assert "date: '2023-06-01'" in content_file.read_text()
+
 
 class TestPublisherConfig:
     """Tests for PublisherConfig options."""
@@ -0,0 +1,35 @@
+"""Tests for slug generation."""
+
+import inflection
+import pytest
+
+from obsidian_publisher.core.slugs import parameterize
+
+
+class TestParameterize:
+    """Tests for the memoized parameterize()."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("My Note", "my-note"),
+        ("Donald E. Knuth", "donald-e-knuth"),
+        ("  --Leading and trailing--  ", "leading-and-trailing"),
+        ("snake_case_title", "snake_case_title"),
+        ("C++ / Rust: a comparison!", "c-rust-a-comparison"),
+        ("", ""),
+    ])
+    def test_ascii(self, text, expected):
+        assert parameterize(text) == expected
+
+    def test_non_ascii_uses_transliteration(self):
+        assert parameterize("Café Société") == "cafe-societe"
+
+    @pytest.mark.parametrize("text", [
+        "Graph Theory (Part 2)",
+        "a--b__c",
+        "tab\tand\nnewline",
+        "~!@#$%^&*()[]{}",
+        "Ærøskøbing — Danish",
+        "100% ready?",
+    ])
+    def test_matches_inflection(self, text):
+        assert parameterize(text) == inflection.parameterize(text)
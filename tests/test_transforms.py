@@ -1,9 +1,9 @@
 """Tests for transform factories."""
 
-import pytest
-import tempfile
-import shutil
+import dataclasses
+import sys
 from pathlib import Path
+from types import MappingProxyType
 
 from obsidian_publisher.transforms.links import relative_link, absolute_link, hugo_ref
 from obsidian_publisher.transforms.tags import identity, filter_by_prefix, replace_separator, compose
@@ -63,10 +63,7 @@ class TestTagTransforms:
     def test_filter_by_prefix_multiple(self):
         transform = filter_by_prefix("domain", "type")
         tags = ["domain/cs", "type/post", "status/ok"]
-        result = transform(tags)
-        assert "domain/cs" in result
-        assert "type/post" in result
-        assert "status/ok" not in result
+        assert transform(tags) == ["domain/cs", "type/post"]
 
     def test_filter_by_prefix_no_match(self):
         transform = filter_by_prefix("domain")
@@ -99,116 +96,114 @@ class TestTagTransforms:
         tags = ["status/ok", "domain/z", "domain/a"]
         assert transform(tags) == ["domain-a", "domain-z"]
 
+    def test_compose_nested(self):
+        transform = compose(
+            compose(filter_by_prefix("domain")),
+            compose(replace_separator("/", "-"), sorted),
+        )
+        tags = ["status/ok", "domain/z", "domain/a"]
+        assert transform(tags) == ["domain-a", "domain-z"]
 
-class TestFrontmatterTransforms:
-    """Tests for frontmatter transform factories."""
+    def test_compose_fused_matches_stepwise(self):
+        filt = filter_by_prefix("domain", "type")
+        repl = replace_separator("/", "-")
+        tags = ["domain/cs/algo", "status/ok", "type/post", "domainless"]
+        assert compose(filt, repl)(tags) == repl(filt(tags))
+
+
+# Read-only, so a transform that mutated its input would raise
+_FRONTMATTER = MappingProxyType({"original": "data"})
+# Interned so note fields and assertions share one object per string
+_TITLE = sys.intern("Test Note")
+_SLUG = sys.intern("test-note")
+_TAGS_IN = [sys.intern("domain/cs")]
+_TAGS_OUT = [sys.intern("domain-cs")]
+_DATE = sys.intern("2024-01-01 00:00:00+0000")
+
+# Built once; hugo_frontmatter closures hold no per-call state
+_HUGO_FM_AUTHORED = hugo_frontmatter("Kishore Kumar")
+_HUGO_FM_NO_AUTHOR = hugo_frontmatter()
+_HUGO_FM_AUTHOR_STR = hugo_frontmatter("Author")
+
+
+# Shared note for the frontmatter transform tests. The transforms only read
+# it, and variants are derived with dataclasses.replace. The note file never
+# needs to exist.
+_BASE_META = NoteMetadata(
+    context=NoteContext(path=Path("test-note.md")),
+    title=_TITLE,
+    slug=_SLUG,
+    frontmatter=_FRONTMATTER,
+    tags=_TAGS_IN,
+    creation_date=_DATE,
+    publication_date=_DATE,
+)
+_PROCESSED = ProcessedNote(
+    metadata=_BASE_META,
+    content="# Test",
+    frontmatter=_FRONTMATTER,
+    tags=_TAGS_OUT,  # Processed tags
+    referenced_images=[],
+    missing_links=[],
+)
 
-    @pytest.fixture
-    def temp_dir(self):
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def mock_processed(self, temp_dir):
-        """Create a mock ProcessedNote for testing frontmatter transforms."""
-        # Create a temp file for NoteContext
-        file_path = temp_dir / "test-note.md"
-        file_path.write_text("---\ntitle: Test Note\n---\n# Test")
-
-        metadata = NoteMetadata(
-            context=NoteContext(path=file_path),
-            title="Test Note",
-            slug="test-note",
-            frontmatter={"original": "data"},
-            tags=["domain/cs"],
-            creation_date="2024-01-01 00:00:00+0000",
-            publication_date="2024-01-01 00:00:00+0000",
-        )
 
-        return ProcessedNote(
-            metadata=metadata,
-            content="# Test",
-            frontmatter={"original": "data"},
-            tags=["domain-cs"],  # Processed tags
-            referenced_images=[],
-            missing_links=[],
-        )
+class TestFrontmatterTransforms:
+    """Tests for frontmatter transform factories."""
 
-    def test_identity(self, mock_processed):
+    def test_identity(self):
         transform = fm_identity()
         fm = {"a": 1, "b": 2}
-        result = transform(fm, mock_processed)
+        result = transform(fm, _PROCESSED)
         assert result == {"a": 1, "b": 2}
 
-    def test_identity_empty(self, mock_processed):
+    def test_identity_empty(self):
         transform = fm_identity()
-        assert transform({}, mock_processed) == {}
+        assert transform({}, _PROCESSED) == {}
 
-    def test_prune_keep_keys(self, mock_processed):
+    def test_prune_keep_keys(self):
         transform = prune_and_add(keep_keys=["a"])
         fm = {"a": 1, "b": 2, "c": 3}
-        assert transform(fm, mock_processed) == {"a": 1}
+        assert transform(fm, _PROCESSED) == {"a": 1}
 
-    def test_prune_remove_keys(self, mock_processed):
+    def test_prune_remove_keys(self):
         transform = prune_and_add(remove_keys=["b"])
         fm = {"a": 1, "b": 2, "c": 3}
-        result = transform(fm, mock_processed)
+        result = transform(fm, _PROCESSED)
         assert result == {"a": 1, "c": 3}
 
-    def test_prune_add_fields(self, mock_processed):
+    def test_prune_add_fields(self):
         transform = prune_and_add(add_fields={"x": 1})
         fm = {"a": 1}
-        result = transform(fm, mock_processed)
+        result = transform(fm, _PROCESSED)
         assert result == {"a": 1, "x": 1}
 
-    def test_prune_combined(self, mock_processed):
+    def test_prune_combined(self):
         transform = prune_and_add(keep_keys=["a"], add_fields={"x": 1})
         fm = {"a": 1, "b": 2}
-        result = transform(fm, mock_processed)
+        result = transform(fm, _PROCESSED)
         assert result == {"a": 1, "x": 1}
 
-    def test_hugo_frontmatter_with_author(self, mock_processed):
-        transform = hugo_frontmatter("Kishore Kumar")
-        fm = {"original": "data"}
-        result = transform(fm, mock_processed)
-        assert result["title"] == "Test Note"
+    def test_hugo_frontmatter_with_author(self):
+        result = _HUGO_FM_AUTHORED(_FRONTMATTER, _PROCESSED)
+        assert result["title"] == _TITLE
         assert result["author"] == "Kishore Kumar"
-        assert result["date"] == "2024-01-01 00:00:00+0000"
-        assert result["doc"] == "2024-01-01 00:00:00+0000"
-        assert result["tags"] == ["domain-cs"]
-
-    def test_hugo_frontmatter_without_author(self, mock_processed):
-        transform = hugo_frontmatter()
-        fm = {}
-        result = transform(fm, mock_processed)
+        assert result["date"] == _DATE
+        assert result["doc"] == _DATE
+        assert result["tags"] == _TAGS_OUT
+
+    def test_hugo_frontmatter_without_author(self):
+        result = _HUGO_FM_NO_AUTHOR(_FRONTMATTER, _PROCESSED)
         assert "author" not in result
-        assert "title" in result
+        assert result["title"] == _TITLE
 
-    def test_hugo_frontmatter_no_processed_tags(self, temp_dir):
+    def test_hugo_frontmatter_no_processed_tags(self):
         """Test hugo_frontmatter when there are no processed tags."""
-        file_path = temp_dir / "no-tags.md"
-        file_path.write_text("---\ntitle: Test\n---\nContent")
-
-        metadata = NoteMetadata(
-            context=NoteContext(path=file_path),
-            title="Test",
-            slug="test",
-            frontmatter={},
-            tags=[],
-            creation_date="2024-01-01",
-            publication_date="2024-01-01",
-        )
-
-        processed = ProcessedNote(
-            metadata=metadata,
-            content="Content",
-            frontmatter={},
+        processed = dataclasses.replace(
+            _PROCESSED,
+            metadata=dataclasses.replace(_BASE_META, tags=[], title="Test", slug="test"),
             tags=[],  # Empty tags
-            referenced_images=[],
-            missing_links=[],
         )
 
-        transform = hugo_frontmatter("Author")
-        result = transform({}, processed)
+        result = _HUGO_FM_AUTHOR_STR(MappingProxyType({}), processed)
         assert "tags" not in result